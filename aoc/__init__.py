@@ -0,0 +1,3 @@
+"""
+Shared utilities for the solutions of all days.
+"""
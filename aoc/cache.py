@@ -0,0 +1,230 @@
+"""
+Opt-in on-disk cache of parsed inputs and answers shared across runs.
+
+Entries are addressed by the SHA-256 of the input file combined with the
+version of the solver, i.e. a hash of the sources in the decorated function's
+directory and in this package, so editing any of them invalidates the results.
+Parsed arrays are stored as .npy files and memory-mapped on a hit, which skips
+parsing entirely, while answers are stored as small JSON files.
+
+Every file is written to a temporary name and atomically renamed, so that
+concurrent processes never see partial entries. Once the cache outgrows its
+size limit, the least recently used files are evicted under an exclusive lock.
+When AOC_CACHE is unset, both decorators return functions untouched.
+
+Environment variables:
+AOC_CACHE=1      Enable the cache
+AOC_CACHE_DIR    Directory to keep the entries in (~/.cache/aoc)
+AOC_CACHE_BYTES  Size limit of all entries in bytes (1 GiB)
+
+Usage:
+@cache.arrays()
+def heights(path: str) -> np.ndarray:
+    ...
+
+@cache.answers()
+def answers(path: str) -> tuple[int, int]:
+    ...
+"""
+
+import contextlib
+import functools
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+Function = TypeVar("Function", bound=Callable[..., Any])
+
+ENABLED = os.environ.get("AOC_CACHE", "") not in ("", "0")
+DIRECTORY = Path(os.environ.get("AOC_CACHE_DIR", Path.home() / ".cache" / "aoc"))
+MAX_BYTES = int(os.environ.get("AOC_CACHE_BYTES", 1 << 30))
+
+CHUNK_BYTES = 1 << 24  # Upper bound on the input hashed at a time
+
+_digests: dict[tuple, str] = {}
+
+
+def arrays(name: Optional[str] = None) -> Callable[[Function], Function]:
+    """Return a decorator caching arrays, or tuples of them, parsed from a path.
+
+    The first argument must be the path of the input. Any other arguments
+    become part of the key, hence they must have a stable repr().
+    """
+
+    def decorator(function: Function) -> Function:
+        if not ENABLED:
+            return function
+        label = name or function.__qualname__
+        version = _version(_directory(function))
+
+        @functools.wraps(function)
+        def wrapper(path: str, *args: Any, **kwargs: Any) -> Any:
+            key = _key(path, version, label, args, kwargs)
+            if (value := _load_arrays(key)) is not None:
+                return value
+            value = function(path, *args, **kwargs)
+            _store_arrays(key, value)
+            return value
+
+        return wrapper  # type: ignore
+
+    return decorator
+
+
+def answers(name: Optional[str] = None) -> Callable[[Function], Function]:
+    """Return a decorator caching a tuple of answers computed from a path."""
+
+    def decorator(function: Function) -> Function:
+        if not ENABLED:
+            return function
+        label = name or function.__qualname__
+        version = _version(_directory(function))
+
+        @functools.wraps(function)
+        def wrapper(path: str, *args: Any, **kwargs: Any) -> Any:
+            key = _key(path, version, label, args, kwargs)
+            if (manifest := _load_manifest(key)) is not None:
+                return tuple(manifest["answers"])
+            value = function(path, *args, **kwargs)
+            _store_manifest(key, {"answers": list(value)})
+            return value
+
+        return wrapper  # type: ignore
+
+    return decorator
+
+
+def digest(path: str | os.PathLike) -> str:
+    """Return the SHA-256 of a file, remembered until the file changes."""
+    status = os.stat(path)
+    identity = (os.path.realpath(path), status.st_size, status.st_mtime_ns)
+    if identity not in _digests:
+        sha256 = hashlib.sha256()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(CHUNK_BYTES), b""):
+                sha256.update(chunk)
+        _digests[identity] = sha256.hexdigest()
+    return _digests[identity]
+
+
+def evict(max_bytes: int = MAX_BYTES) -> int:
+    """Remove least recently used files above the limit and return their count."""
+    with _locked():
+        entries = []
+        for path in [*DIRECTORY.glob("*.npy"), *DIRECTORY.glob("*.json")]:
+            with contextlib.suppress(FileNotFoundError):
+                status = path.stat()
+                entries.append((status.st_mtime_ns, status.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= max_bytes:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                path.unlink()
+                removed += 1
+            total -= size
+    return removed
+
+
+def clear() -> None:
+    """Remove all entries from the cache."""
+    evict(max_bytes=0)
+
+
+@functools.lru_cache(maxsize=None)
+def _version(directory: Path) -> str:
+    """Return a hash of the sources that parsers and solvers depend on."""
+    package = Path(__file__).parent
+    sha256 = hashlib.sha256()
+    for path in sorted(directory.glob("*.py")) + sorted(package.glob("*.py")):
+        sha256.update(path.name.encode("utf-8"))
+        sha256.update(path.read_bytes())
+    return sha256.hexdigest()
+
+
+def _directory(function: Callable) -> Path:
+    return Path(inspect.getfile(function)).resolve().parent
+
+
+def _key(path: str, version: str, label: str, args: tuple, kwargs: dict) -> str:
+    sha256 = hashlib.sha256(f"{version}:{label}:{args!r}:{kwargs!r}".encode("utf-8"))
+    sha256.update(digest(path).encode("ascii"))
+    return sha256.hexdigest()
+
+
+def _load_arrays(key: str) -> Optional[np.ndarray | tuple[np.ndarray, ...]]:
+    """Return memory-mapped arrays of an entry or None when any is missing."""
+    if (manifest := _load_manifest(key)) is None:
+        return None
+    values = []
+    for i in range(manifest["arrays"]):
+        path = DIRECTORY / f"{key}-{i}.npy"
+        try:
+            values.append(np.load(path, mmap_mode="r", allow_pickle=False))
+            os.utime(path)
+        except (FileNotFoundError, ValueError):
+            return None  # Evicted or truncated meanwhile
+    return tuple(values) if manifest["tuple"] else values[0]
+
+
+def _store_arrays(key: str, value: np.ndarray | tuple[np.ndarray, ...]) -> None:
+    values = value if isinstance(value, tuple) else (value,)
+    for i, array in enumerate(values):
+        with _atomic(f"{key}-{i}.npy") as file:
+            np.save(file, np.asarray(array), allow_pickle=False)
+    # The manifest goes last, so that its presence implies complete arrays
+    _store_manifest(key, {"arrays": len(values), "tuple": isinstance(value, tuple)})
+
+
+def _load_manifest(key: str) -> Optional[dict[str, Any]]:
+    path = DIRECTORY / f"{key}-manifest.json"
+    try:
+        with open(path, encoding="utf-8") as file:
+            manifest = json.load(file)
+        os.utime(path)
+    except (FileNotFoundError, ValueError):
+        return None
+    return manifest
+
+
+def _store_manifest(key: str, manifest: dict[str, Any]) -> None:
+    with _atomic(f"{key}-manifest.json") as file:
+        file.write(json.dumps(manifest).encode("utf-8"))
+    evict()
+
+
+@contextlib.contextmanager
+def _atomic(name: str) -> Iterator[Any]:
+    """Yield a temporary binary file renamed to the given name on success."""
+    DIRECTORY.mkdir(parents=True, exist_ok=True)
+    descriptor, temporary = tempfile.mkstemp(dir=DIRECTORY, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            yield file
+        os.replace(temporary, DIRECTORY / name)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(temporary)
+        raise
+
+
+@contextlib.contextmanager
+def _locked() -> Iterator[None]:
+    """Hold an exclusive lock on the cache across processes, where supported."""
+    DIRECTORY.mkdir(parents=True, exist_ok=True)
+    with open(DIRECTORY / ".lock", "wb") as file:
+        if fcntl:
+            fcntl.flock(file, fcntl.LOCK_EX)
+        yield
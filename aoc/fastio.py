@@ -0,0 +1,168 @@
+"""
+Bulk parsing of puzzle inputs memory-mapped straight into typed arrays.
+
+The whole file is mapped into a read-only array of bytes and every kind of
+input is decoded with array-wide operations, never creating a Python object
+per line. Large buffers are parsed in chunks aligned to record boundaries,
+which bounds the size of the temporary arrays regardless of the input size.
+
+Usage:
+from aoc import fastio
+depths = fastio.integers(fastio.read("input.txt"))
+"""
+
+import os
+from typing import TypeAlias
+
+import numpy as np
+
+ByteRange: TypeAlias = tuple[str, int, int]  # Path, start and end byte offsets
+
+CHUNK_BYTES = 1 << 24  # Upper bound on the bytes parsed at a time
+
+
+def read(path: str | os.PathLike) -> np.ndarray:
+    """Return a read-only array of bytes mapped onto the file."""
+    if os.path.getsize(path) == 0:
+        return np.empty(0, dtype=np.uint8)
+    return np.memmap(path, dtype=np.uint8, mode="r")
+
+
+def line_ranges(path: str, count: int) -> list[ByteRange]:
+    """Return up to the given number of byte ranges aligned to line breaks.
+
+    Ranges are roughly equal in size, cover the whole file, and never split
+    a line, so that each one can be parsed on its own, e.g. by a worker.
+    """
+    size = os.path.getsize(path)
+    offsets = [0]
+    with open(path, "rb") as file:
+        for i in range(1, count):
+            file.seek(max(size * i // count, offsets[-1]))
+            file.readline()  # Skip to the beginning of the next line
+            offsets.append(min(file.tell(), size))
+    offsets.append(size)
+    return [(path, a, b) for a, b in zip(offsets, offsets[1:]) if b > a]
+
+
+def integers(buffer: np.ndarray, dtype: np.dtype = np.int64) -> np.ndarray:
+    """Return all decimal integers separated by any non-digit bytes.
+
+    This covers numbers on separate lines, comma-separated lists, and
+    records with several numbers per line alike.
+
+    A minus sign immediately preceding the digits makes a number negative.
+    Numbers must have at most eighteen digits.
+
+    Sample output:
+    array([199, 200, 208, 210, 200, 207, 240, 269, 260, 263])
+    """
+    chunks, start = [], 0
+    while start < len(buffer):
+        end = min(start + CHUNK_BYTES, len(buffer))
+        while end < len(buffer) and ord("0") <= buffer[end - 1] <= ord("9"):
+            end += 1  # Never split a number across chunks
+        chunks.append(_integers(buffer, start, end))
+        start = end
+    if not chunks:
+        return np.empty(0, dtype=dtype)
+    return np.concatenate(chunks).astype(dtype, copy=False)
+
+
+def records(buffer: np.ndarray, fields: int) -> np.ndarray:
+    """Return integers grouped into rows with the given number of fields.
+
+    Sample output for "0,9 -> 5,9" lines:
+    array([[0, 9, 5, 9],
+           [8, 0, 0, 8],
+           ...
+    """
+    return integers(buffer).reshape(-1, fields)
+
+
+def split_line(buffer: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return the first line and the remaining bytes without copying."""
+    end = _line_end(buffer)
+    return buffer[:end], buffer[end + 1 :]
+
+
+def digit_grid(buffer: np.ndarray) -> np.ndarray:
+    """Return a (rows x columns) matrix of single-digit values, one byte each.
+
+    Sample output:
+    array([[2, 1, 9, 9, 9, 4, 3, 2, 1, 0],
+           [3, 9, 8, 7, 8, 9, 4, 9, 2, 1],
+           ...
+    """
+    return _lines(buffer) - np.uint8(ord("0"))
+
+
+def bits(buffer: np.ndarray) -> np.ndarray:
+    """Return a boolean (rows x columns) matrix of binary digits."""
+    return _lines(buffer) == ord("1")
+
+
+def binary(buffer: np.ndarray) -> np.ndarray:
+    """Return numbers written in binary, one per line, up to 63 bits wide.
+
+    Sample output:
+    array([ 4, 30, 22, 23, 21, 15,  7, 28, 16, 25,  2, 10])
+    """
+    matrix = bits(buffer)
+    rows, width = matrix.shape
+    padded = np.zeros((rows, -(-width // 8) * 8), dtype=bool)  # Whole bytes
+    padded[:, padded.shape[1] - width :] = matrix
+    numbers = np.zeros(rows, dtype=np.uint64)
+    for column in np.packbits(padded).reshape(rows, padded.shape[1] // 8).T:
+        numbers = numbers << np.uint64(8) | column
+    return numbers.astype(np.int64)
+
+
+def _integers(buffer: np.ndarray, start: int, end: int) -> np.ndarray:
+    """Return integers found in a range of bytes that doesn't split any.
+
+    Numbers are accumulated digit by digit with Horner's method, where the
+    k-th step only updates numbers having more than k digits.
+    """
+    chunk = buffer[start:end]
+    values = chunk - np.uint8(ord("0"))  # Non-digits wrap around above nine
+    padded = np.zeros(len(chunk) + 2, dtype=bool)
+    padded[1:-1] = values < 10
+    bounds = np.flatnonzero(padded[1:] != padded[:-1])
+    starts, lengths = bounds[0::2], bounds[1::2] - bounds[0::2]
+    values = np.append(values, np.zeros(19, dtype=np.uint8))  # Room to read past
+    numbers = values[starts].astype(np.int64)
+    for k in range(1, int(lengths.max(initial=0))):
+        longer = lengths > k
+        if longer.all():
+            numbers = numbers * 10 + values[starts + k]
+        else:
+            numbers = np.where(longer, numbers * 10 + values[starts + k], numbers)
+    signs = np.where(starts > 0, chunk[np.maximum(starts - 1, 0)], 0)
+    if start > 0 and len(starts) and starts[0] == 0:
+        signs[0] = buffer[start - 1]  # A sign might have ended the previous chunk
+    numbers[signs == ord("-")] *= -1
+    return numbers
+
+
+def _lines(buffer: np.ndarray) -> np.ndarray:
+    """Return a (rows x columns) view of fixed-length lines without breaks."""
+    width = _line_end(buffer)
+    stride = width + 1
+    if width > 0 and buffer[width - 1] == ord("\r"):
+        width -= 1
+    rows = (len(buffer) + stride - 1) // stride
+    if rows and (rows - 1) * stride + width > len(buffer):
+        rows -= 1  # Trailing bytes shorter than a line, e.g. a final newline
+    return np.lib.stride_tricks.as_strided(
+        buffer, shape=(rows, width), strides=(stride, 1), writeable=False
+    )
+
+
+def _line_end(buffer: np.ndarray) -> int:
+    """Return the index of the first line break or the length of the buffer."""
+    for start in range(0, len(buffer), CHUNK_BYTES):
+        breaks = np.flatnonzero(buffer[start : start + CHUNK_BYTES] == ord("\n"))
+        if len(breaks):
+            return start + int(breaks[0])
+    return len(buffer)
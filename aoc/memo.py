@@ -0,0 +1,128 @@
+"""
+Bounded and inspectable memoization with optional on-disk persistence.
+
+Usage:
+from aoc import memo
+
+@memo.memoize(maxsize=1024, path="offsprings.pickle")
+def offsprings(days: int) -> int:
+    ...
+"""
+
+import functools
+import os
+import pickle
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Iterable, Optional
+
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+    bytes: int = 0  # Shallow size of the cached keys and values
+
+    @property
+    def hit_rate(self) -> float:
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+
+class Memoized:
+    """A function wrapper caching results in least recently used order."""
+
+    def __init__(
+        self,
+        function: Callable,
+        maxsize: Optional[int] = None,
+        path: Optional[str] = None,
+    ) -> None:
+        functools.update_wrapper(self, function)
+        self.function = function
+        self.maxsize = maxsize
+        self.path = path
+        self.cache: OrderedDict[Hashable, Any] = OrderedDict()
+        self._stats = CacheStats()
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def __call__(self, *args: Hashable) -> Any:
+        # Recursive calls on a miss happen outside of any exception handler,
+        # which would otherwise add a frame and chain exceptions at each level
+        value = self.cache.get(args, _MISSING)
+        if value is _MISSING:
+            self._stats.misses += 1
+            value = self.function(*args)
+            self._store(args, value)
+        else:
+            self._stats.hits += 1
+            self.cache.move_to_end(args)
+        return value
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(**vars(self._stats) | {"size": len(self.cache)})
+
+    def cached(self, *args: Hashable) -> bool:
+        """Return True if a result is cached, without counting a hit or a miss."""
+        return args in self.cache
+
+    def warm_up(self, arguments: Iterable[Hashable]) -> None:
+        """Precompute results for the given arguments in order.
+
+        For recursive functions depending on smaller arguments only, passing
+        them in ascending order keeps the recursion one level deep, provided
+        that maxsize is large enough not to evict the results still needed.
+        """
+        for argument in arguments:
+            self(argument)
+
+    def cache_clear(self) -> None:
+        self.cache.clear()
+        self._stats = CacheStats()
+
+    def save(self, path: Optional[str] = None) -> None:
+        """Write the cached results to a file atomically."""
+        path = path or self.path
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as file:
+            pickle.dump(list(self.cache.items()), file, pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+
+    def load(self, path: Optional[str] = None) -> None:
+        """Read cached results from a file written by save()."""
+        with open(path or self.path, "rb") as file:
+            items = pickle.load(file)
+        for key, value in items[-self.maxsize :] if self.maxsize else items:
+            self._store(key, value)
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        if key not in self.cache:
+            self._stats.bytes += _sizeof(key, value)
+        self.cache[key] = value
+        self.cache.move_to_end(key)
+        while self.maxsize is not None and len(self.cache) > self.maxsize:
+            evicted_key, evicted_value = self.cache.popitem(last=False)
+            self._stats.bytes -= _sizeof(evicted_key, evicted_value)
+            self._stats.evictions += 1
+
+
+def memoize(
+    maxsize: Optional[int] = None, path: Optional[str] = None
+) -> Callable[[Callable], Memoized]:
+    """Return a decorator caching up to maxsize results of a function."""
+
+    def decorator(function: Callable) -> Memoized:
+        return Memoized(function, maxsize, path)
+
+    return decorator
+
+
+def _sizeof(key: Hashable, value: Any) -> int:
+    return sys.getsizeof(key) + sys.getsizeof(value)
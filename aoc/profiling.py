@@ -0,0 +1,215 @@
+"""
+Opt-in instrumentation of solver stages such as loading, transforming or solving.
+
+Stages are marked with the profile() decorator or the stage() context manager,
+and record their number of calls, wall and CPU time, and optionally memory
+allocated through tracemalloc. Both are switched on at import time by the
+AOC_PROFILE environment variable. When it's unset, profile() returns functions
+untouched and stage() a shared no-op context, so there's no overhead at all.
+
+Results are written at exit as a JSON summary, including hit rates of tracked
+caches, and as collapsed stacks of self times in microseconds, which can be
+fed straight into flamegraph.pl or speedscope.
+
+Environment variables:
+AOC_PROFILE=1         Enable timing of stages
+AOC_PROFILE_MEMORY=1  Also trace allocations, which slows everything down
+AOC_PROFILE_OUTPUT    Directory to write the results to (current directory)
+
+Usage:
+@profiling.profile()
+def load(path: str) -> list[int]:
+    ...
+
+with profiling.stage("windows"):
+    ...
+"""
+
+import atexit
+import contextlib
+import functools
+import json
+import multiprocessing.util
+import os
+import time
+import tracemalloc
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, ContextManager, Optional, TypeVar
+
+Function = TypeVar("Function", bound=Callable[..., Any])
+
+
+def _flag(name: str) -> bool:
+    return os.environ.get(name, "") not in ("", "0")
+
+
+ENABLED = _flag("AOC_PROFILE")
+MEMORY = ENABLED and _flag("AOC_PROFILE_MEMORY")
+OUTPUT = os.environ.get("AOC_PROFILE_OUTPUT", ".")
+
+
+@dataclass
+class StageStats:
+    calls: int = 0
+    wall: float = 0.0  # Seconds including nested stages
+    cpu: float = 0.0
+    allocated: int = 0  # Net bytes still allocated after the stage
+    peak: int = 0  # Highest bytes allocated on top of the stage's start
+
+
+class _Frame:
+    __slots__ = ("name", "wall", "cpu", "children", "memory", "peak")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.children = 0.0
+        if MEMORY:
+            self.memory, peak = tracemalloc.get_traced_memory()
+            if _frames:
+                _frames[-1].peak = max(_frames[-1].peak, peak)
+            tracemalloc.reset_peak()
+            self.peak = self.memory
+        self.wall = time.perf_counter()
+        self.cpu = time.process_time()
+
+
+_stats: defaultdict[str, StageStats] = defaultdict(StageStats)
+_stacks: defaultdict[str, float] = defaultdict(float)  # Self time by stack
+_frames: list[_Frame] = []
+_caches: dict[str, Any] = {}
+
+
+class _Stage:
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __enter__(self) -> None:
+        _frames.append(_Frame(self.name))
+
+    def __exit__(self, *exc_info: Any) -> None:
+        wall, cpu = time.perf_counter(), time.process_time()
+        frame = _frames.pop()
+        stats = _stats[frame.name]
+        stats.calls += 1
+        stats.wall += wall - frame.wall
+        stats.cpu += cpu - frame.cpu
+        if MEMORY:
+            memory, peak = tracemalloc.get_traced_memory()
+            peak = max(frame.peak, peak)
+            stats.allocated += memory - frame.memory
+            stats.peak = max(stats.peak, peak - frame.memory)
+            if _frames:
+                _frames[-1].peak = max(_frames[-1].peak, peak)
+        stack = ";".join([parent.name for parent in _frames] + [frame.name])
+        _stacks[stack] += wall - frame.wall - frame.children
+        if _frames:
+            _frames[-1].children += wall - frame.wall
+
+
+_DISABLED = contextlib.nullcontext()
+
+
+def stage(name: str) -> ContextManager[None]:
+    """Return a context manager measuring the enclosed block as a stage."""
+    return _Stage(name) if ENABLED else _DISABLED
+
+
+def profile(name: Optional[str] = None) -> Callable[[Function], Function]:
+    """Return a decorator measuring every call of a function as a stage."""
+
+    def decorator(function: Function) -> Function:
+        if not ENABLED:
+            return function
+        label = name or f"{function.__module__}.{function.__qualname__}"
+
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with _Stage(label):
+                return function(*args, **kwargs)
+
+        return wrapper  # type: ignore
+
+    return decorator
+
+
+def track_cache(name: str, cached: Any) -> None:
+    """Report hit rates of a memoized or functools cached function."""
+    if ENABLED:
+        _caches[name] = cached
+
+
+def cache_stats(cached: Any) -> dict[str, Any]:
+    """Return hits, misses, and the hit rate of a cached function."""
+    if hasattr(cached, "stats"):  # See memo.Memoized
+        stats = cached.stats
+        return asdict(stats) | {"hit_rate": stats.hit_rate}
+    info = cached.cache_info()
+    calls = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "hit_rate": info.hits / calls if calls else 0.0,
+    }
+
+
+def summary() -> dict[str, Any]:
+    """Return a JSON-serializable summary of all stages and caches."""
+    return {
+        "pid": os.getpid(),
+        "memory": MEMORY,
+        "stages": {name: asdict(stats) for name, stats in _stats.items()},
+        "caches": {name: cache_stats(cached) for name, cached in _caches.items()},
+    }
+
+
+def collapsed() -> str:
+    """Return self times of stacks of stages in microseconds, one per line."""
+    return "".join(
+        f"{stack} {round(seconds * 1e6)}\n" for stack, seconds in _stacks.items()
+    )
+
+
+def export(directory: str = OUTPUT) -> tuple[str, str]:
+    """Write the summary and collapsed stacks to files and return their paths."""
+    prefix = os.path.join(directory, f"profile-{time.strftime('%Y%m%d-%H%M%S')}")
+    prefix += f"-{os.getpid()}"
+    os.makedirs(directory, exist_ok=True)
+    with open(prefix + ".json", "w", encoding="utf-8") as file:
+        json.dump(summary(), file, indent=2)
+    with open(prefix + ".folded", "w", encoding="utf-8") as file:
+        file.write(collapsed())
+    return prefix + ".json", prefix + ".folded"
+
+
+def reset() -> None:
+    """Forget all stages recorded so far."""
+    _stats.clear()
+    _stacks.clear()
+
+
+def _export_at_exit() -> None:
+    global _exported_by
+    if _stats and _exported_by != os.getpid():
+        _exported_by = os.getpid()
+        export()
+
+
+def _start_process(*_: Any) -> None:
+    # Worker processes of multiprocessing skip atexit but run its finalizers,
+    # whose registry is cleared in every forked child
+    reset()
+    multiprocessing.util.Finalize(None, _export_at_exit, exitpriority=0)
+
+
+_exported_by: Optional[int] = None
+
+if ENABLED:
+    if MEMORY:
+        tracemalloc.start()
+    atexit.register(_export_at_exit)
+    _start_process()
+    multiprocessing.util.register_after_fork(_start_process, _start_process)
@@ -0,0 +1,194 @@
+"""
+Reproducible generators of valid puzzle inputs of arbitrary sizes.
+
+Each generator writes a given number of records, e.g. lines, bingo boards or
+comma-separated numbers, to a text file in blocks, so that even inputs with
+hundreds of millions of records never need to fit in memory. Records that are
+expensive to make one by one are sampled from a pool drawn up front.
+"""
+
+from typing import Callable, Iterator, TextIO, TypeAlias
+
+import numpy as np
+
+Generator: TypeAlias = Callable[[TextIO, int, np.random.Generator], None]
+
+BLOCK_SIZE = 1 << 20  # Number of records formatted at a time
+POOL_SIZE = 1 << 12  # Number of distinct records to sample from
+
+GENERATORS: dict[int, Generator] = {}
+
+
+def generator(day: int) -> Callable[[Generator], Generator]:
+    """Return a decorator adding an input generator of a day to the registry."""
+
+    def decorator(function: Generator) -> Generator:
+        GENERATORS[day] = function
+        return function
+
+    return decorator
+
+
+def generate(day: int, path: str, size: int, seed: int = 42) -> None:
+    """Write an input of the given day with the given number of records."""
+    with open(path, "w", encoding="utf-8") as file:
+        GENERATORS[day](file, size, np.random.default_rng(seed))
+
+
+def blocks(size: int, block_size: int = BLOCK_SIZE) -> Iterator[int]:
+    """Return an iterator of block lengths adding up to the given size."""
+    for start in range(0, size, block_size):
+        yield min(block_size, size - start)
+
+
+def write_lines(file: TextIO, lines: list[str]) -> None:
+    file.write("\n".join(lines))
+    file.write("\n")
+
+
+def write_numbers(file: TextIO, size: int, sample: Callable[[int], np.ndarray]) -> None:
+    """Write one line of comma-separated numbers sampled in blocks."""
+    separator = ""
+    for length in blocks(size):
+        file.write(separator + ",".join(map(str, sample(length).tolist())))
+        separator = ","
+    file.write("\n")
+
+
+def write_pool(
+    file: TextIO, size: int, rng: np.random.Generator, pool: list[str]
+) -> None:
+    """Write lines sampled with replacement from a pool of distinct lines."""
+    for length in blocks(size):
+        write_lines(file, [pool[i] for i in rng.integers(0, len(pool), length)])
+
+
+@generator(1)
+def depths(file: TextIO, size: int, rng: np.random.Generator) -> None:
+    """Random walk of seafloor depths drifting downwards."""
+    depth = 1000
+    for length in blocks(size):
+        walk = depth + np.cumsum(rng.integers(-10, 13, length))
+        write_lines(file, list(map(str, np.abs(walk).tolist())))
+        depth = int(walk[-1])
+
+
+@generator(2)
+def course(file: TextIO, size: int, rng: np.random.Generator) -> None:
+    """Submarine commands with down moves outweighing up moves."""
+    commands = np.array(["forward", "down", "up"])
+    for length in blocks(size):
+        directions = commands[rng.choice(3, length, p=[0.5, 0.3, 0.2])]
+        distances = rng.integers(1, 10, length).astype(str)
+        write_lines(file, np.char.add(np.char.add(directions, " "), distances).tolist())
+
+
+@generator(3)
+def diagnostics(file: TextIO, size: int, rng: np.random.Generator) -> None:
+    """Distinct binary numbers at least twelve bits wide.
+
+    The original day-03 filtering fails on duplicates, so the width grows with
+    the size to leave room for distinct numbers drawn without replacement.
+    """
+    width = max(12, size.bit_length() + 1)
+    numbers = rng.choice(1 << width, size, replace=False)
+    for start in range(0, size, BLOCK_SIZE):
+        block = numbers[start : start + BLOCK_SIZE].tolist()
+        write_lines(file, [f"{number:0{width}b}" for number in block])
+
+
+@generator(4)
+def bingo(file: TextIO, size: int, rng: np.random.Generator) -> None:
+    """Draws of all numbers below 100 followed by 5x5 boards of unique numbers."""
+    file.write(",".join(map(str, rng.permutation(100).tolist())) + "\n")
+    for length in blocks(size, BLOCK_SIZE // 64):
+        boards = rng.random((length, 100)).argsort(axis=1)[:, :25].reshape(-1, 5, 5)
+        cells = np.full((length, 5, 5, 3), ord(" "), dtype=np.uint8)
+        cells[..., 0] = np.where(boards < 10, ord(" "), boards // 10 + ord("0"))
+        cells[..., 1] = boards % 10 + ord("0")
+        cells[:, :, -1, 2] = ord("\n")
+        blank_lines = np.full((length, 1), ord("\n"), dtype=np.uint8)
+        text = np.hstack([blank_lines, cells.reshape(length, -1)])
+        file.write(text.tobytes().decode("ascii"))
+
+
+@generator(5)
+def vents(file: TextIO, size: int, rng: np.random.Generator) -> None:
+    """Horizontal, vertical and diagonal lines within a 1000x1000 grid."""
+    for length in blocks(size):
+        x1, y1 = rng.integers(0, 1000, (2, length))
+        span = rng.integers(1, 200, length) * rng.choice([-1, 1], length)
+        kind = rng.integers(0, 3, length)
+        slope = rng.choice([-1, 1], length)  # Diagonals going either way
+        x2 = np.clip(np.where(kind == 1, x1, x1 + span), 0, 999)
+        y2 = np.where(kind == 0, y1, y1 + np.where(kind == 2, slope * (x2 - x1), span))
+        y2 = np.clip(y2, 0, 999)
+        x2 = np.where(kind == 2, x1 + np.sign(x2 - x1) * np.abs(y2 - y1), x2)
+        write_lines(
+            file,
+            [
+                f"{a},{b} -> {c},{d}"
+                for a, b, c, d in zip(*(v.tolist() for v in (x1, y1, x2, y2)))
+            ],
+        )
+
+
+@generator(6)
+def timers(file: TextIO, size: int, rng: np.random.Generator) -> None:
+    """Internal timers of lanternfish between one and five."""
+    write_numbers(file, size, lambda length: rng.integers(1, 6, length))
+
+
+@generator(7)
+def crabs(file: TextIO, size: int, rng: np.random.Generator) -> None:
+    """Horizontal positions of crabs clustered near the origin."""
+    write_numbers(file, size, lambda length: rng.geometric(1 / 400, length) - 1)
+
+
+@generator(8)
+def readings(file: TextIO, size: int, rng: np.random.Generator) -> None:
+    """Ten unique patterns and four output digits wired at random."""
+    digits = "abcefg cf acdeg acdfg bcdf abdfg abdefg acf abcdefg abcdfg".split()
+    pool = []
+    for _ in range(POOL_SIZE):
+        wiring = str.maketrans("abcdefg", "".join(rng.permutation(list("abcdefg"))))
+        scrambled = [
+            "".join(rng.permutation(list(digit.translate(wiring)))) for digit in digits
+        ]
+        patterns = " ".join(scrambled[i] for i in rng.permutation(10))
+        output = " ".join(scrambled[i] for i in rng.integers(0, 10, 4))
+        pool.append(f"{patterns} | {output}")
+    write_pool(file, size, rng, pool)
+
+
+@generator(9)
+def heights(file: TextIO, size: int, rng: np.random.Generator) -> None:
+    """Rows of a height map 100 digits wide with basins walled by nines."""
+    for length in blocks(size, BLOCK_SIZE // 64):
+        values = rng.integers(0, 9, (length, 100), dtype=np.uint8)
+        values[rng.random(values.shape, dtype=np.float32) < 0.45] = 9
+        newlines = np.full((length, 1), ord("\n"), dtype=np.uint8)
+        file.write(np.hstack([values + ord("0"), newlines]).tobytes().decode("ascii"))
+
+
+@generator(10)
+def chunks(file: TextIO, size: int, rng: np.random.Generator) -> None:
+    """Lines of brackets, mostly incomplete, some with an illegal symbol."""
+    opening, closing = "([{<", ")]}>"
+    pool = []
+    for _ in range(POOL_SIZE):
+        stack, symbols = [], []
+        for push, kind in zip(rng.random(100) < 0.55, rng.integers(0, 4, 100)):
+            if push or not stack:
+                stack.append(kind)
+                symbols.append(opening[kind])
+            else:
+                symbols.append(closing[stack.pop()])
+        if rng.random() < 0.5:  # Close a bracket with a mismatched one
+            position = int(
+                rng.choice([i for i, x in enumerate(symbols) if x in opening])
+            )
+            mismatched = closing.replace(closing[opening.index(symbols[position])], "")
+            symbols.insert(position + 1, mismatched[int(rng.integers(0, 3))])
+        pool.append("".join(symbols))
+    write_pool(file, size, rng, pool)
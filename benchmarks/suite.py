@@ -0,0 +1,222 @@
+"""
+Benchmark loaders and solvers of all days on generated inputs of many sizes.
+
+Every case is timed on its own, excluding any setup such as loading the input
+for the solvers, and then run once more under tracemalloc to find its peak
+memory. Results can be saved as a JSON baseline and compared against later.
+The original part1 and part2 of some days scale quadratically, so large sizes
+are best restricted to the loaders and answers with --cases.
+
+Usage:
+$ python suite.py --sizes 1000 100000 --save baseline.json
+$ python suite.py --sizes 1000 100000 --compare baseline.json --threshold 0.25
+$ python suite.py 1 5 --sizes 100000000 --cases load answers --data /tmp/inputs
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Optional, TypeAlias
+
+import numpy as np
+
+from generators import GENERATORS, generate
+
+sys.path.append(str(Path(__file__).parents[1]))
+
+from run import import_day  # noqa: E402
+
+Setup: TypeAlias = Callable[[ModuleType, str], Any]
+Function: TypeAlias = Callable[[ModuleType, Any], Any]
+
+LOADERS: dict[int, Setup] = {
+    5: lambda day, path: (day.load(path), day.load(path, use_diagonals=True)),
+    9: lambda day, path: day.HeightMap.from_file(path),
+    10: lambda day, path: day.load(Path(path)),
+}
+PARTS: dict[int, tuple[Function, Function]] = {
+    1: (
+        lambda day, depths: day.count(depths),
+        lambda day, depths: day.count(day.summed(day.windows(depths))),
+    ),
+    4: (lambda day, bingo: bingo.first_score, lambda day, bingo: bingo.last_score),
+    5: (lambda day, lines: day.solve(lines[0]), lambda day, lines: day.solve(lines[1])),
+    6: (lambda day, fish: day.solve(fish, 80), lambda day, fish: day.solve(fish, 256)),
+}
+
+
+@dataclass(frozen=True)
+class Case:
+    day: int
+    name: str
+    function: Function
+    setup: Optional[Setup] = None
+
+
+@dataclass(frozen=True)
+class Result:
+    day: int
+    case: str
+    size: int
+    seconds: float
+    peak_bytes: int
+    megabytes_per_second: float
+    lines_per_second: float
+    error: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        return f"day-{self.day:02d}/{self.case}/{self.size}"
+
+    def __str__(self) -> str:
+        if self.error:
+            return f"{self.key:<28} {self.error}"
+        return (
+            f"{self.key:<28} {self.seconds:10.4f} s {self.peak_bytes / 2**20:10.1f} MB"
+            f" {self.megabytes_per_second:10.1f} MB/s {self.lines_per_second:14,.0f} lines/s"
+        )
+
+
+def cases(day: int) -> list[Case]:
+    """Return the loader, both parts, and the fastest answers of a day."""
+    load = LOADERS.get(day, lambda d, path: d.load(path))
+    part1, part2 = PARTS.get(day, (lambda d, x: d.part1(x), lambda d, x: d.part2(x)))
+    return [
+        Case(day, "load", load),
+        Case(day, "part1", part1, setup=load),
+        Case(day, "part2", part2, setup=load),
+        Case(day, "answers", lambda d, path: d.answers(path)),
+    ]
+
+
+def measure(case: Case, path: str, size: int, repeat: int = 1) -> Result:
+    """Return the best time and the peak memory of a case on one input."""
+    day = import_day(case.day)
+    timings = []
+    try:
+        argument = case.setup(day, path) if case.setup else path
+        for _ in range(repeat):
+            start = time.perf_counter()
+            case.function(day, argument)
+            timings.append(time.perf_counter() - start)
+        tracemalloc.start()
+        try:
+            case.function(day, argument)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    except Exception as ex:
+        return Result(case.day, case.name, size, 0.0, 0, 0.0, 0.0, repr(ex))
+
+    seconds = min(timings)
+    with open(path, "rb") as file:
+        lines = sum(
+            chunk.count(b"\n") for chunk in iter(lambda: file.read(1 << 20), b"")
+        )
+    return Result(
+        case.day,
+        case.name,
+        size,
+        seconds,
+        peak,
+        os.path.getsize(path) / 2**20 / seconds,
+        lines / seconds,
+    )
+
+
+def benchmark(
+    days: list[int],
+    sizes: list[int],
+    names: Optional[list[str]] = None,
+    data: Optional[str] = None,
+    seed: int = 42,
+    repeat: int = 3,
+) -> list[Result]:
+    """Return results of all cases on inputs generated for each size.
+
+    Inputs are written to the data directory and reused when they exist,
+    otherwise to a temporary directory removed afterwards.
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for day in days:
+            for size in sizes:
+                path = os.path.join(
+                    data or directory, f"day-{day:02d}-{size}-{seed}.txt"
+                )
+                if not os.path.exists(path):
+                    generate(day, path, size, seed)
+                for case in cases(day):
+                    if names is None or case.name in names:
+                        results.append(result := measure(case, path, size, repeat))
+                        print(result, flush=True)
+    return results
+
+
+def save(results: list[Result], path: str) -> None:
+    """Write results to a JSON baseline along with the environment."""
+    baseline = {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "results": [asdict(result) for result in results],
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(baseline, file, indent=2)
+
+
+def compare(results: list[Result], path: str, threshold: float) -> list[str]:
+    """Return descriptions of results slower or hungrier than the baseline."""
+    with open(path, encoding="utf-8") as file:
+        results_before = [Result(**fields) for fields in json.load(file)["results"]]
+    baseline = {result.key: result for result in results_before}
+    regressions = []
+    for result in results:
+        if (before := baseline.get(result.key)) is None or before.error:
+            continue
+        if result.error:
+            regressions.append(f"{result.key} failed: {result.error}")
+            continue
+        for metric in ("seconds", "peak_bytes"):
+            old, new = getattr(before, metric), getattr(result, metric)
+            if old > 0 and new > old * (1 + threshold):
+                regressions.append(f"{result.key} {metric}: {old:g} -> {new:g}")
+    return regressions
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("days", nargs="*", type=int, help="day numbers (all)")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1000, 100_000])
+    parser.add_argument("--cases", nargs="+", help="load, part1, part2, answers")
+    parser.add_argument("--data", help="directory to keep generated inputs in")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save", help="path of a JSON baseline to write")
+    parser.add_argument("--compare", help="path of a JSON baseline to check")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    return parser.parse_args()
+
+
+def main(args: argparse.Namespace) -> int:
+    days = args.days or sorted(GENERATORS)
+    results = benchmark(days, args.sizes, args.cases, args.data, args.seed, args.repeat)
+    if args.save:
+        save(results, args.save)
+    if args.compare:
+        if regressions := compare(results, args.compare, args.threshold):
+            print("Regressions:", *regressions, sep="\n")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(parse_args()))
@@ -0,0 +1,63 @@
+"""
+Compare the throughput of the list-based, streaming and NumPy sonar sweeps.
+
+The NumPy timing excludes the one-off conversion of the text input to .npy.
+
+Usage:
+$ python benchmark.py [number_of_depths]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from solution import count, load, summed, windows
+from streaming import convert, count_mmap, sweep
+
+
+def main(length: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "depths.txt")
+        npy_path = os.path.join(directory, "depths.npy")
+        generate(path, length)
+        megabytes = os.path.getsize(path) / 2**20
+        convert(path, npy_path)
+
+        def list_based():
+            depths = load(path)
+            return count(depths), count(summed(windows(depths)))
+
+        def streaming():
+            return sweep(path, widths=(1, 3))
+
+        def numpy_based():
+            return count_mmap(npy_path, width=1), count_mmap(npy_path, width=3)
+
+        print(f"{length:,} depths ({megabytes:.1f} MB)")
+        results = set()
+        for name, function in [
+            ("list", list_based),
+            ("streaming", streaming),
+            ("numpy (mmap)", numpy_based),
+        ]:
+            start = time.perf_counter()
+            results.add(function())
+            elapsed = time.perf_counter() - start
+            print(f"{name:>14}: {elapsed:8.3f} s {megabytes / elapsed:10.1f} MB/s")
+        assert len(results) == 1, results
+
+
+def generate(path: str, length: int, seed: int = 42) -> None:
+    """Write a random walk of seafloor depths to a text file."""
+    rng = random.Random(seed)
+    depth = 1000
+    with open(path, "w", encoding="utf-8") as file:
+        for _ in range(length):
+            depth = max(0, depth + rng.randint(-10, 12))
+            file.write(f"{depth}\n")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,122 @@
+"""
+Sliding window aggregations with O(1) amortized updates for any window width.
+
+The pure Python generators keep a running total or a monotonic deque of
+indices, while their NumPy counterparts work on whole arrays at once using
+cumulative sums and blockwise running extremes.
+"""
+
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from operator import ge, le
+from typing import Callable
+
+import numpy as np
+
+
+def increases(depths: Sequence[int], width: int = 3) -> int:
+    """Return the number of times the sliding window total increases.
+
+    This is equivalent to count(summed(windows(depths, width))) but runs in
+    O(n) regardless of the window width, because the consecutive window
+    totals only differ by the first and the last element.
+    """
+    return sum(1 for x, y in zip(depths, depths[width:]) if y > x)
+
+
+def rolling_sum(values: Iterable[int], width: int) -> Iterator[int]:
+    """Return an iterator of sliding window totals."""
+    window = deque()
+    total = 0
+    for value in values:
+        window.append(value)
+        total += value
+        if len(window) > width:
+            total -= window.popleft()
+        if len(window) == width:
+            yield total
+
+
+def rolling_mean(values: Iterable[int], width: int) -> Iterator[float]:
+    """Return an iterator of sliding window averages."""
+    return (total / width for total in rolling_sum(values, width))
+
+
+def rolling_min(values: Iterable[int], width: int) -> Iterator[int]:
+    """Return an iterator of sliding window minimums."""
+    return _rolling_extreme(values, width, keep=le)
+
+
+def rolling_max(values: Iterable[int], width: int) -> Iterator[int]:
+    """Return an iterator of sliding window maximums."""
+    return _rolling_extreme(values, width, keep=ge)
+
+
+def _rolling_extreme(
+    values: Iterable[int], width: int, keep: Callable[[int, int], bool]
+) -> Iterator[int]:
+    """Return an iterator of window extremes using a monotonic deque.
+
+    The deque holds (index, value) pairs whose values are monotonic, so the
+    current extreme is always at the front. Each value enters and leaves the
+    deque at most once.
+    """
+    candidates = deque()
+    for index, value in enumerate(values):
+        while candidates and not keep(candidates[-1][1], value):
+            candidates.pop()
+        candidates.append((index, value))
+        if candidates[0][0] <= index - width:
+            candidates.popleft()
+        if index >= width - 1:
+            yield candidates[0][1]
+
+
+def increases_np(depths: np.ndarray, width: int = 3) -> int:
+    """Return the number of times the sliding window total increases."""
+    depths = np.asarray(depths)
+    return int(np.count_nonzero(depths[width:] > depths[:-width]))
+
+
+def rolling_sum_np(values: np.ndarray, width: int) -> np.ndarray:
+    """Return an array of sliding window totals based on a cumulative sum."""
+    if len(values) < width:
+        return np.empty(0, dtype=np.int64)
+    totals = np.cumsum(values, dtype=np.int64)
+    return np.concatenate(([totals[width - 1]], totals[width:] - totals[:-width]))
+
+
+def rolling_mean_np(values: np.ndarray, width: int) -> np.ndarray:
+    """Return an array of sliding window averages."""
+    return rolling_sum_np(values, width) / width
+
+
+def rolling_min_np(values: np.ndarray, width: int) -> np.ndarray:
+    """Return an array of sliding window minimums."""
+    return _rolling_extreme_np(values, width, np.minimum)
+
+
+def rolling_max_np(values: np.ndarray, width: int) -> np.ndarray:
+    """Return an array of sliding window maximums."""
+    return _rolling_extreme_np(values, width, np.maximum)
+
+
+def _rolling_extreme_np(
+    values: np.ndarray, width: int, extreme: np.ufunc
+) -> np.ndarray:
+    """Return an array of window extremes in O(n) for any window width.
+
+    This is the van Herk/Gil-Werman algorithm. Values are split into blocks of
+    the window width, each holding running extremes from its start (prefix)
+    and towards its end (suffix). Every window spans the tail of one block
+    and the head of the next, so its extreme combines one of each.
+    """
+    values = np.asarray(values)
+    if len(values) < width:
+        return np.empty(0, dtype=values.dtype)
+    # Padded values never reach the suffixes of the windows returned
+    blocks = np.pad(values, (0, -len(values) % width), mode="edge").reshape(-1, width)
+    prefix = extreme.accumulate(blocks, axis=1).ravel()
+    suffix = extreme.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+    count = len(values) - width + 1
+    return extreme(suffix[:count], prefix[width - 1 : width - 1 + count])
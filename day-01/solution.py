@@ -7,26 +7,48 @@ $ python solution.py input.txt
 """
 
 import sys
+from pathlib import Path
+
+from rolling import increases, increases_np
+from streaming import sweep
+
+sys.path.append(str(Path(__file__).parents[1]))
+
+from aoc import cache, fastio, profiling  # noqa: E402
 
 
 def main(path: str) -> None:
     """Load input data and assert the solution."""
+    depths = load(path)
 
     # Part 1
-    assert 1711 == count(load(path))
+    assert 1711 == count(depths)
 
     # Part 2
-    assert 1743 == count(summed(windows(load(path))))
+    assert 1743 == count(summed(windows(depths)))
+    assert 1743 == increases(depths, width=3)
+    assert (1711, 1743) == answers(path)
+
+    # Both parts in a single streaming pass
+    assert (1711, 1743) == sweep(path, widths=(1, 3))
+
+
+@profiling.profile()
+@cache.answers()
+def answers(path: str) -> tuple[int, int]:
+    """Return the answers to both parts."""
+    depths = fastio.integers(fastio.read(path))
+    return increases_np(depths, width=1), increases_np(depths, width=3)
 
 
+@profiling.profile()
 def load(path: str) -> list[int]:
     """Return a list of seafloor depth measurements.
 
     Sample output:
     [199, 200, 208, 210, 200, 207, 240, 269, 260, 263]
     """
-    with open(path, encoding="utf-8") as file:
-        return [int(line) for line in file]
+    return fastio.integers(fastio.read(path)).tolist()
 
 
 # Straightforward implementation:
@@ -47,15 +69,17 @@ def count(depths: list[int]) -> int:
     return sum(1 for x, y in zip(depths, depths[1:]) if y - x > 0)
 
 
-def windows(depths: list[int]) -> list[list[int]]:
-    """Return a list of three-element sliding windows.
+@profiling.profile()
+def windows(depths: list[int], width: int = 3) -> list[list[int]]:
+    """Return a list of sliding windows, three-element by default.
 
     Sample output:
     [[199, 200, 208], [200, 208, 210], ..., [269, 260, 263]]
     """
-    return [depths[i : i + 3] for i in range(len(depths) - 2)]
+    return [depths[i : i + width] for i in range(len(depths) - width + 1)]
 
 
+@profiling.profile()
 def summed(windows):
     """Return a list of sliding window totals.
 
@@ -0,0 +1,79 @@
+"""
+Constant-memory sonar sweep over arbitrarily large depth logs.
+
+Comparing two consecutive sliding windows of width k boils down to comparing
+the two depths that differ between them, i.e. depths[i + k] > depths[i],
+because all the other terms of both sums cancel out. Therefore, counting the
+increases only requires remembering the last k depths.
+"""
+
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+
+CHUNK_SIZE = 1 << 20  # Bytes
+
+
+def sweep(
+    path: str, widths: Iterable[int] = (1, 3), chunk_size: int = CHUNK_SIZE
+) -> tuple[int, ...]:
+    """Return the number of depth increases for each window width in one pass.
+
+    Sample output:
+    (7, 5)
+    """
+    widths = tuple(widths)
+    size = max(widths)
+    ring = [0] * size  # The last `size` depths, indexed modulo `size`
+    counts = [0] * len(widths)
+    index = 0
+    for depths in read_chunks(path, chunk_size):
+        for depth in depths:
+            for i, width in enumerate(widths):
+                if index >= width and depth > ring[(index - width) % size]:
+                    counts[i] += 1
+            ring[index % size] = depth
+            index += 1
+    return tuple(counts)
+
+
+def read_chunks(path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[list[int]]:
+    """Return an iterator of depth lists read from fixed-size file chunks."""
+    with open(path, "rb") as file:
+        remainder = b""
+        while chunk := file.read(chunk_size):
+            lines = (remainder + chunk).split(b"\n")
+            remainder = lines.pop()
+            yield [int(line) for line in lines if line.strip()]
+        if remainder.strip():
+            yield [int(remainder)]
+
+
+def convert(path: str, npy_path: str, chunk_size: int = CHUNK_SIZE) -> None:
+    """Write depths from a text file to a binary .npy file of int64 numbers."""
+    total = sum(len(depths) for depths in read_chunks(path, chunk_size))
+    array = np.lib.format.open_memmap(
+        npy_path, mode="w+", dtype=np.int64, shape=(total,)
+    )
+    offset = 0
+    for depths in read_chunks(path, chunk_size):
+        array[offset : offset + len(depths)] = depths
+        offset += len(depths)
+    array.flush()
+
+
+def count_mmap(npy_path: str, width: int = 1, chunk_length: int = CHUNK_SIZE) -> int:
+    """Return the number of depth increases in a memory-mapped .npy file.
+
+    Consecutive chunks overlap by `width` elements, so that no comparison
+    across the chunk boundary gets lost.
+    """
+    depths = np.load(npy_path, mmap_mode="r")
+    total = 0
+    for start in range(0, max(len(depths) - width, 0), chunk_length):
+        chunk = depths[start : start + chunk_length + width]
+        if width == 1:
+            total += np.count_nonzero(np.diff(chunk) > 0)
+        else:
+            total += np.count_nonzero(chunk[width:] > chunk[:-width])
+    return int(total)
@@ -0,0 +1,85 @@
+"""
+Vectorized replay of the whole submarine course at once.
+
+Commands are parsed into two parallel NumPy arrays, one with direction codes
+(the first letter of each direction) and another with distances.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from models import Position, PositionWithAim
+
+FORWARD, DOWN, UP = b"fdu"
+
+# Lookup table indexed by direction codes
+STEERING = np.zeros(256, dtype=np.int64)
+STEERING[DOWN], STEERING[UP] = 1, -1
+
+# Lookup table of direction codes indexed by the last letter of each direction
+LAST_LETTERS = np.zeros(256, dtype=np.uint8)
+LAST_LETTERS[[ord("d"), ord("n"), ord("p")]] = FORWARD, DOWN, UP
+
+
+class Course(NamedTuple):
+    directions: np.ndarray
+    distances: np.ndarray
+
+    @classmethod
+    def from_file(cls, path: str) -> "Course":
+        return cls.from_buffer(np.fromfile(path, dtype=np.uint8))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Course":
+        return cls.from_buffer(np.frombuffer(data, dtype=np.uint8))
+
+    @classmethod
+    def from_buffer(cls, buffer: np.ndarray) -> "Course":
+        """Return a course parsed from raw bytes without splitting lines.
+
+        Each line consists of a direction word, a single space, and a number,
+        so finding the spaces is the only scan of the whole buffer. The last
+        letters of the words tell the directions apart, and each distance is
+        accumulated from the digits following its space for as long as any
+        line has more of them, which is usually just once.
+        """
+        end = len(buffer)
+        while end > 0 and buffer[end - 1] <= ord(" "):
+            end -= 1  # Skip trailing whitespace
+        if end == 0:
+            return cls(np.empty(0, dtype=np.uint8), np.empty(0, dtype=np.int64))
+
+        buffer = np.append(buffer[:end], np.uint8(ord("\n")))  # Stop the last number
+        spaces = np.flatnonzero(buffer == ord(" "))
+        directions = LAST_LETTERS[buffer[spaces - 1]]
+
+        distances = buffer[spaces + 1].astype(np.int64) - ord("0")
+        lines, places = np.arange(len(spaces)), spaces + 2
+        while True:
+            digits = buffer[places] - np.uint8(ord("0"))  # Non-digits wrap around
+            more = digits < 10
+            if not more.any():
+                break
+            lines, places, digits = lines[more], places[more] + 1, digits[more]
+            distances[lines] = distances[lines] * 10 + digits
+
+        return cls(directions, distances)
+
+    @property
+    def aims(self) -> np.ndarray:
+        """Return the change of aim (or depth in part 1) for each command."""
+        return STEERING[self.directions] * self.distances
+
+    @property
+    def forwards(self) -> np.ndarray:
+        """Return the horizontal distance travelled by each command."""
+        return (self.directions == FORWARD) * self.distances
+
+    def position(self) -> Position:
+        return Position(int(self.forwards.sum()), int(self.aims.sum()))
+
+    def position_with_aim(self) -> PositionWithAim:
+        forwards, aims = self.forwards, self.aims
+        depth = np.dot(np.cumsum(aims), forwards)
+        return PositionWithAim(int(forwards.sum()), int(depth), int(aims.sum()))
@@ -0,0 +1,75 @@
+"""
+Mergeable summaries of course segments for parallel replay.
+
+A segment summary records how the submarine's state changes over a stretch
+of commands, assuming zero initial aim. Summaries of consecutive segments
+combine associatively, so shards can be replayed independently and merged
+in order afterwards.
+"""
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from pathlib import Path
+from typing import NamedTuple, TypeAlias
+
+import numpy as np
+
+from batch import Course
+from models import Position, PositionWithAim
+
+sys.path.append(str(Path(__file__).parents[1]))
+
+from aoc import fastio  # noqa: E402
+
+Shard: TypeAlias = fastio.ByteRange
+
+
+class Segment(NamedTuple):
+    horizontal: int = 0
+    aim: int = 0  # Also the depth change in part 1
+    depth: int = 0  # Sum of forward distances weighted by the aim
+
+    @classmethod
+    def from_course(cls, course: Course) -> "Segment":
+        forwards, aims = course.forwards, course.aims
+        depth = np.dot(np.cumsum(aims), forwards)
+        return cls(int(forwards.sum()), int(aims.sum()), int(depth))
+
+    def then(self, other: "Segment") -> "Segment":
+        """Return the summary of this segment followed by the other one.
+
+        The other segment's forward commands were replayed with zero initial
+        aim, so they need to account for the aim accumulated until now.
+        """
+        return Segment(
+            self.horizontal + other.horizontal,
+            self.aim + other.aim,
+            self.depth + other.depth + self.aim * other.horizontal,
+        )
+
+    def position(self) -> Position:
+        return Position(self.horizontal, self.aim)
+
+    def position_with_aim(self) -> PositionWithAim:
+        return PositionWithAim(self.horizontal, self.depth, self.aim)
+
+
+def replay(paths: list[str], workers: int | None = None) -> Segment:
+    """Return the summary of the whole course split across files and cores."""
+    workers = workers or os.cpu_count() or 1
+    tasks = [shard for path in paths for shard in fastio.line_ranges(path, workers)]
+    if workers == 1:
+        summaries = map(summarize, tasks)
+        return reduce(Segment.then, summaries, Segment())
+    with ProcessPoolExecutor(workers) as executor:
+        summaries = executor.map(summarize, tasks)
+        return reduce(Segment.then, summaries, Segment())
+
+
+def summarize(shard: Shard) -> Segment:
+    """Return the summary of a byte range of a course file."""
+    path, start, end = shard
+    buffer = np.fromfile(path, dtype=np.uint8, count=end - start, offset=start)
+    return Segment.from_course(Course.from_buffer(buffer))
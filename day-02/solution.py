@@ -6,8 +6,15 @@ Usage:
 $ python solution.py input.txt
 """
 import sys
+from pathlib import Path
 
+from batch import Course
 from models import Command, Position, PositionWithAim
+from segments import Segment, replay
+
+sys.path.append(str(Path(__file__).parents[1]))
+
+from aoc import cache, profiling  # noqa: E402
 
 
 def main(path: str) -> None:
@@ -15,11 +22,29 @@ def main(path: str) -> None:
     assert part1(load(path)) == 1524750
     assert part2(load(path)) == 1592426537
 
+    course = Course.from_file(path)
+    assert course.position().product == 1524750
+    assert course.position_with_aim().product == 1592426537
+
+    summary = replay([path])
+    assert summary.position().product == 1524750
+    assert summary.position_with_aim().product == 1592426537
+
+
+@profiling.profile()
+@cache.answers()
+def answers(path: str) -> tuple[int, int]:
+    """Return the answers to both parts."""
+    summary = Segment.from_course(Course.from_file(path))
+    return summary.position().product, summary.position_with_aim().product
+
 
+@profiling.profile()
 def part1(commands: list[Command]) -> int:
     return solve(commands, Position())
 
 
+@profiling.profile()
 def part2(commands: list[Command]) -> int:
     return solve(commands, PositionWithAim())
 
@@ -30,6 +55,7 @@ def solve(commands: list[Command], position: Position | PositionWithAim) -> int:
     return position.product
 
 
+@profiling.profile()
 def load(path: str) -> list[Command]:
     """Return a list of course commands.
 
@@ -0,0 +1,49 @@
+"""
+Compare the list filtering and sorted index life support ratings.
+
+Usage:
+$ python benchmark.py [number_of_readings ...]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from solution import co2_scrubber, oxygen
+from sortedindex import SortedIndex
+
+WIDTH = 32
+
+
+def main(lengths: list[int]) -> None:
+    for length in lengths:
+        numbers = generate(length)
+
+        def filtering():
+            return oxygen(numbers) * co2_scrubber(numbers)
+
+        def sorted_index():
+            index = SortedIndex(numbers)
+            return index.oxygen() * index.co2_scrubber()
+
+        print(f"{length:,} readings")
+        results = set()
+        for name, function in [("filter", filtering), ("sorted index", sorted_index)]:
+            start = time.perf_counter()
+            results.add(function())
+            print(f"{name:>14}: {time.perf_counter() - start:8.3f} s")
+        assert len(results) == 1, results
+
+
+def generate(length: int, seed: int = 42) -> list[int]:
+    """Return a list of distinct random diagnostic numbers.
+
+    Filtering the list fails on duplicates, hence drawing without replacement.
+    """
+    rng = np.random.default_rng(seed)
+    return rng.choice(2**WIDTH, length, replace=False).tolist()
+
+
+if __name__ == "__main__":
+    main([int(x) for x in sys.argv[1:]] or [1_000_000, 10_000_000])
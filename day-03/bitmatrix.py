@@ -0,0 +1,63 @@
+"""
+Diagnostic reports as bit matrices with one row per number.
+
+Bits are stored most significant first, exactly as they appear in the input,
+so that the gamma rate can be derived from the column popcounts alone.
+"""
+
+import numpy as np
+
+CHUNK_ROWS = 1 << 20
+
+
+def load(path: str) -> np.ndarray:
+    """Return a boolean matrix parsed straight from the input file.
+
+    Sample output:
+    array([[False, False,  True, False, False],
+           [ True,  True,  True,  True, False],
+           ...
+    """
+    buffer = np.fromfile(path, dtype=np.uint8)
+    return _parse(buffer, *_layout(buffer))
+
+
+def popcounts(matrix: np.ndarray) -> tuple[np.ndarray, int]:
+    """Return the number of one bits in each column and the number of rows."""
+    return matrix.sum(axis=0), len(matrix)
+
+
+def stream_popcounts(path: str, chunk_rows: int = CHUNK_ROWS) -> tuple[np.ndarray, int]:
+    """Return column popcounts computed from chunks of rows read one by one."""
+    with open(path, "rb") as file:
+        stride, width = _layout(np.frombuffer(file.readline(), dtype=np.uint8))
+        file.seek(0)
+        counts, rows = np.zeros(width, dtype=np.int64), 0
+        while chunk := file.read(stride * chunk_rows):
+            matrix = _parse(np.frombuffer(chunk, dtype=np.uint8), stride, width)
+            counts += matrix.sum(axis=0, dtype=np.int64)
+            rows += len(matrix)
+        return counts, rows
+
+
+def gamma(counts: np.ndarray, rows: int) -> int:
+    """Return a number made of the most common bits in each column."""
+    result = 0
+    for bit_count in counts:
+        result = result << 1 | int(bit_count > rows - bit_count)
+    return result
+
+
+def _layout(buffer: np.ndarray) -> tuple[int, int]:
+    """Return the line length with and without the line terminator."""
+    terminators = np.flatnonzero((buffer != ord("0")) & (buffer != ord("1")))
+    width = terminators[0] if len(terminators) else len(buffer)
+    crlf = width < len(buffer) and buffer[width] == ord("\r")
+    return int(width) + 1 + crlf, int(width)
+
+
+def _parse(buffer: np.ndarray, stride: int, width: int) -> np.ndarray:
+    """Return a boolean matrix from a buffer of fixed-length lines."""
+    if len(buffer) % stride:
+        buffer = np.append(buffer, np.zeros(-len(buffer) % stride, np.uint8))
+    return buffer.reshape(-1, stride)[:, :width] == ord("1")
@@ -7,6 +7,14 @@ $ python solution.py input.txt
 """
 import sys
 from operator import ge, lt
+from pathlib import Path
+
+import bitmatrix
+from sortedindex import SortedIndex
+
+sys.path.append(str(Path(__file__).parents[1]))
+
+from aoc import cache, fastio, profiling  # noqa: E402
 
 
 def main(path: str) -> None:
@@ -14,22 +22,43 @@ def main(path: str) -> None:
     assert part1(load(path)) == 4001724
     assert part2(load(path)) == 587895
 
+    counts, rows = bitmatrix.popcounts(bitmatrix.load(path))
+    assert (g := bitmatrix.gamma(counts, rows)) * epsilon(g) == 4001724
+
+    counts, rows = bitmatrix.stream_popcounts(path)
+    assert (g := bitmatrix.gamma(counts, rows)) * epsilon(g) == 4001724
+
+    index = SortedIndex(load(path))
+    assert index.oxygen() * index.co2_scrubber() == 587895
+
+
+@profiling.profile()
+@cache.answers()
+def answers(path: str) -> tuple[int, int]:
+    """Return the answers to both parts."""
+    counts, rows = bitmatrix.popcounts(bitmatrix.load(path))
+    g = bitmatrix.gamma(counts, rows)
+    index = SortedIndex(load(path))
+    return g * epsilon(g), index.oxygen() * index.co2_scrubber()
+
 
+@profiling.profile()
 def load(path: str) -> list[int]:
     """Return a list of decimal numbers.
 
     Sample output:
     [4, 30, 22, 23, 21, 15, 7, 28, 16, 25, 2, 10]
     """
-    with open(path, encoding="utf-8") as file:
-        return [int(line, 2) for line in file]
+    return fastio.binary(fastio.read(path)).tolist()
 
 
+@profiling.profile()
 def part1(numbers: list[int]) -> int:
     """Return the power consumption of the submarine."""
     return (g := gamma(numbers)) * epsilon(g)
 
 
+@profiling.profile()
 def part2(numbers: list[int]) -> int:
     """Return the life support rating of the submarine."""
     return oxygen(numbers) * co2_scrubber(numbers)
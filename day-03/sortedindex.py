@@ -0,0 +1,39 @@
+"""
+Bit criteria filtering over a sorted array of diagnostic numbers.
+
+Once the numbers are sorted, the ones sharing a common prefix of bits form a
+contiguous [lo, hi) range, which splits into numbers with the next bit unset
+followed by numbers with that bit set. Each filtering step thus narrows the
+range with a single binary search instead of copying the remaining numbers.
+"""
+
+import numpy as np
+
+
+class SortedIndex:
+    def __init__(self, numbers: list[int] | np.ndarray) -> None:
+        self.numbers = np.sort(np.asarray(numbers, dtype=np.int64))
+        self.width = int(self.numbers[-1]).bit_length()
+
+    def oxygen(self) -> int:
+        """Return the oxygen generator rating."""
+        return self.rating(most_common_bit=True)
+
+    def co2_scrubber(self) -> int:
+        """Return the CO2 scrubber rating."""
+        return self.rating(most_common_bit=False)
+
+    def rating(self, most_common_bit: bool = True) -> int:
+        """Return the only number left after filtering by the bit criteria."""
+        lo, hi, prefix = 0, len(self.numbers), 0
+        for bit_index in reversed(range(self.width)):
+            if hi - lo <= 1:
+                break
+            bit = 1 << bit_index
+            split = lo + int(np.searchsorted(self.numbers[lo:hi], prefix | bit))
+            ones, zeros = hi - split, split - lo
+            if (ones >= zeros) if most_common_bit else (ones < zeros):
+                lo, prefix = split, prefix | bit
+            else:
+                hi = split
+        return int(self.numbers[hi - 1])
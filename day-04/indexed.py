@@ -0,0 +1,64 @@
+from typing import Iterator
+
+import numpy as np
+
+
+class IndexedBingoGame:
+    """Bingo played through an inverted index of the numbers on all boards.
+
+    Every drawn number only touches the cells where it occurs, and each board
+    keeps running counts of marked cells per row and column as well as the
+    sum of its unmarked numbers, so a win is detected without rescanning.
+    """
+
+    def __init__(self, random_numbers: np.ndarray, boards: np.ndarray) -> None:
+        self.random_numbers = random_numbers
+        self.boards = boards
+        self.index = make_index(boards)
+
+    @property
+    def first_score(self) -> int:
+        return next(self.final_scores())
+
+    @property
+    def last_score(self) -> int:
+        return list(self.final_scores())[-1]
+
+    def final_scores(self) -> Iterator[int]:
+        num_boards, num_rows, num_cols = self.boards.shape
+        row_hits = np.zeros((num_boards, num_rows), dtype=np.int32)
+        col_hits = np.zeros((num_boards, num_cols), dtype=np.int32)
+        unmarked = self.boards.sum(axis=(1, 2), dtype=np.int64)
+        playing = np.ones(num_boards, dtype=bool)
+        drawn = set()
+        for number in self.random_numbers:
+            if number in drawn or number not in self.index:
+                continue  # Numbers drawn again are already marked
+            drawn.add(number)
+            b, r, c = self.index[number]
+            b, r, c = b[active := playing[b]], r[active], c[active]
+            np.add.at(row_hits, (b, r), 1)
+            np.add.at(col_hits, (b, c), 1)
+            np.subtract.at(unmarked, b, number)
+            winners = np.unique(
+                b[(row_hits[b, r] == num_cols) | (col_hits[b, c] == num_rows)]
+            )
+            playing[winners] = False
+            for board in winners:
+                yield int(unmarked[board]) * int(number)
+
+
+def make_index(boards: np.ndarray) -> dict[int, tuple[np.ndarray, ...]]:
+    """Return a mapping of numbers to their (board, row, col) coordinates.
+
+    Coordinates of each number are ordered by board, which preserves the
+    order in which simultaneously winning boards are reported.
+    """
+    numbers = boards.ravel()
+    order = np.argsort(numbers, kind="stable")
+    unique, starts = np.unique(numbers[order], return_index=True)
+    coordinates = np.unravel_index(order, boards.shape)
+    return {
+        int(number): tuple(axis[start:end] for axis in coordinates)
+        for number, start, end in zip(unique, starts, np.append(starts[1:], len(order)))
+    }
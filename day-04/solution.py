@@ -8,11 +8,18 @@
 
 import sys
 from dataclasses import dataclass
-from operator import truediv as div
+from pathlib import Path
 from typing import Iterator
 
 import numpy as np
 
+from indexed import IndexedBingoGame
+from wintime import WinTimeBingoGame
+
+sys.path.append(str(Path(__file__).parents[1]))
+
+from aoc import cache, fastio, profiling  # noqa: E402
+
 
 class Board:
     def __init__(self, numbers: np.ndarray) -> None:
@@ -40,7 +47,7 @@ class Board:
 @dataclass
 class BingoGame:
     random_numbers: np.ndarray
-    boards: list[Board]
+    boards: np.ndarray
 
     @property
     def first_score(self) -> int:
@@ -51,12 +58,13 @@ class BingoGame:
         return list(self.final_scores())[-1]
 
     def final_scores(self) -> Iterator[int]:
+        boards = [Board(numbers) for numbers in self.boards]
         for number in self.random_numbers:
-            for board in self.boards[:]:
+            for board in boards[:]:
                 board.play(number)
                 if board.wins:
                     yield board.score * number
-                    self.boards.remove(board)
+                    boards.remove(board)
 
 
 def main(path: str) -> None:
@@ -64,12 +72,37 @@ def main(path: str) -> None:
     assert bingo.first_score == 25023
     assert bingo.last_score == 2634
 
+    indexed = IndexedBingoGame(bingo.random_numbers, bingo.boards)
+    assert indexed.first_score == 25023
+    assert indexed.last_score == 2634
+
+    vectorized = WinTimeBingoGame(bingo.random_numbers, bingo.boards)
+    assert vectorized.first_score == 25023
+    assert vectorized.last_score == 2634
+
 
+@profiling.profile()
+@cache.answers()
+def answers(path: str) -> tuple[int, int]:
+    """Return the answers to both parts."""
+    bingo = load(path)
+    vectorized = WinTimeBingoGame(bingo.random_numbers, bingo.boards)
+    return int(vectorized.first_score), int(vectorized.last_score)
+
+
+@profiling.profile()
 def load(path: str) -> BingoGame:
-    with open(path, encoding="utf-8") as file:
-        random_numbers = np.fromstring(file.readline(), dtype=int, sep=",")
-        boards_numbers = np.vsplit(a := np.loadtxt(file, dtype=int), div(*a.shape))
-        return BingoGame(random_numbers, [Board(x) for x in boards_numbers])
+    return BingoGame(*load_numbers(path))
+
+
+@cache.arrays()
+def load_numbers(path: str) -> tuple[np.ndarray, np.ndarray]:
+    """Return the random numbers and a (boards x rows x columns) array."""
+    random_numbers, boards = fastio.split_line(fastio.read(path))
+    _, boards = fastio.split_line(boards)  # Skip the blank line
+    size = len(fastio.integers(fastio.split_line(boards)[0]))
+    numbers = fastio.integers(boards).reshape(-1, size, size)
+    return fastio.integers(random_numbers), numbers
 
 
 if __name__ == "__main__":
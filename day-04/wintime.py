@@ -0,0 +1,58 @@
+from typing import Iterator
+
+import numpy as np
+
+
+class WinTimeBingoGame:
+    """Bingo solved at once from the turns at which each cell gets marked.
+
+    A line is complete on the turn of its last marked cell, and a board wins
+    on the earliest turn any of its rows or columns is complete. Sorting the
+    boards by that turn yields the order of winning.
+    """
+
+    def __init__(self, random_numbers: np.ndarray, boards: np.ndarray) -> None:
+        self.random_numbers = random_numbers
+        self.boards = boards
+
+    @property
+    def first_score(self) -> int:
+        return next(self.final_scores())
+
+    @property
+    def last_score(self) -> int:
+        return list(self.final_scores())[-1]
+
+    @property
+    def cell_turns(self) -> np.ndarray:
+        """Return the turn at which each cell gets marked, or len() if never."""
+        unique, first_turns = np.unique(self.random_numbers, return_index=True)
+        positions = np.searchsorted(unique, self.boards).clip(max=len(unique) - 1)
+        drawn = unique[positions] == self.boards
+        return np.where(drawn, first_turns[positions], len(self.random_numbers))
+
+    @property
+    def win_turns(self) -> np.ndarray:
+        """Return the turn at which each board wins, or len() if never."""
+        return win_turns(self.cell_turns)
+
+    def ranking(self) -> np.ndarray:
+        """Return indices of the boards that win in the order of winning."""
+        win_turns = self.win_turns
+        order = np.argsort(win_turns, kind="stable")
+        return order[win_turns[order] < len(self.random_numbers)]
+
+    def final_scores(self) -> Iterator[int]:
+        cell_turns = self.cell_turns
+        board_turns = win_turns(cell_turns)
+        unmarked = cell_turns > board_turns[:, np.newaxis, np.newaxis]
+        sums = (self.boards * unmarked).sum(axis=(1, 2))
+        for board in self.ranking():
+            yield int(sums[board]) * int(self.random_numbers[board_turns[board]])
+
+
+def win_turns(cell_turns: np.ndarray) -> np.ndarray:
+    """Return the earliest turn at which any row or column gets completed."""
+    rows = cell_turns.max(axis=2).min(axis=1)
+    cols = cell_turns.max(axis=1).min(axis=1)
+    return np.minimum(rows, cols)
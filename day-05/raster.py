@@ -0,0 +1,92 @@
+"""
+Bulk rasterization of vent lines into flat arrays of grid cell indices.
+
+All segments are expanded into their points at once, without Python loops
+over individual points. Overlaps are counted on a compact dense grid when
+the bounding box is small enough, or by sorting the cell indices otherwise.
+Maps with too many points to sort are left to the analytic sweep, whose
+memory depends on the number of segments rather than their lengths.
+"""
+
+from typing import Callable
+
+import numpy as np
+
+import sweep
+
+MAX_DENSE_CELLS = 1 << 28  # 256 MiB of uint8 counters
+MAX_SORTED_POINTS = 1 << 24  # About 1 GiB of temporary int64 arrays
+
+# A segment never covers the same cell twice, so a batch of this many segments
+# can raise any counter by at most that much without overflowing uint8 after
+# the counters have been saturated at two.
+SEGMENTS_PER_BATCH = np.iinfo(np.uint8).max - 2
+
+
+def load_segments(path: str, use_diagonals: bool = False) -> np.ndarray:
+    """Return an array of (x1, y1, x2, y2) rows of the relevant segments."""
+    with open(path, encoding="utf-8") as file:
+        text = file.read().strip().replace("->", ",").replace("\n", ",")
+    x1, y1, x2, y2 = np.fromstring(text, dtype=np.int64, sep=",").reshape(-1, 4).T
+    dx, dy = np.abs(x2 - x1), np.abs(y2 - y1)
+    keep = (dx == 0) | (dy == 0) | (use_diagonals & (dx == dy))
+    return np.column_stack([x1, y1, x2, y2])[keep]
+
+
+def rasterize(segments: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return the x and y coordinates of all points of all segments."""
+    x1, y1, x2, y2 = segments.T
+    lengths = np.maximum(np.abs(x2 - x1), np.abs(y2 - y1)) + 1
+    owners = np.repeat(np.arange(len(segments)), lengths)
+    steps = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    xs = x1[owners] + np.sign(x2 - x1)[owners] * steps
+    ys = y1[owners] + np.sign(y2 - y1)[owners] * steps
+    return xs, ys
+
+
+def overlaps(
+    segments: np.ndarray,
+    max_dense_cells: int = MAX_DENSE_CELLS,
+    max_sorted_points: int = MAX_SORTED_POINTS,
+) -> int:
+    """Return the number of points where at least two segments overlap."""
+    if len(segments) == 0:
+        return 0
+    xs, ys = segments[:, 0::2], segments[:, 1::2]
+    x0, y0 = xs.min(), ys.min()
+    width, height = xs.max() - x0 + 1, ys.max() - y0 + 1
+
+    def cells(batch: np.ndarray) -> np.ndarray:
+        x, y = rasterize(batch)
+        return (y - y0) * width + (x - x0)
+
+    if width * height <= max_dense_cells:
+        return count_dense(cells, segments, width * height)
+    if count_points(segments) <= max_sorted_points:
+        return count_sorted(cells(segments))
+    return sweep.overlaps(segments)
+
+
+def count_points(segments: np.ndarray) -> int:
+    """Return the total number of points of all segments."""
+    x1, y1, x2, y2 = segments.T
+    return int((np.maximum(np.abs(x2 - x1), np.abs(y2 - y1)) + 1).sum())
+
+
+def count_dense(
+    cells: Callable[[np.ndarray], np.ndarray], segments: np.ndarray, size: int
+) -> int:
+    """Return the number of overlaps counted on a saturating uint8 grid."""
+    grid = np.zeros(size, dtype=np.uint8)
+    for start in range(0, len(segments), SEGMENTS_PER_BATCH):
+        indices = cells(segments[start : start + SEGMENTS_PER_BATCH])
+        np.add.at(grid, indices, np.uint8(1))
+        grid[indices] = np.minimum(grid[indices], 2)
+    return int(np.count_nonzero(grid > 1))
+
+
+def count_sorted(cells: np.ndarray) -> int:
+    """Return the number of cell indices occurring more than once."""
+    cells = np.sort(cells)
+    repeated = cells[1:] == cells[:-1]
+    return int(np.count_nonzero(repeated[1:] & ~repeated[:-1]) + repeated[:1].sum())
@@ -7,10 +7,18 @@
 # """
 
 import sys
+from pathlib import Path
 from typing import Iterator, TypeAlias
 
 import numpy as np
 
+import raster
+import sweep
+
+sys.path.append(str(Path(__file__).parents[1]))
+
+from aoc import cache, fastio, profiling  # noqa: E402
+
 Line: TypeAlias = list[tuple[int, int]]
 
 
@@ -18,7 +26,24 @@ def main(path: str) -> None:
     assert 6267 == solve(load(path))
     assert 20196 == solve(load(path, use_diagonals=True))
 
+    segments = raster.load_segments(path)
+    assert 6267 == raster.overlaps(segments) == sweep.overlaps(segments)
+
+    segments = raster.load_segments(path, use_diagonals=True)
+    assert 20196 == raster.overlaps(segments) == sweep.overlaps(segments)
+
+
+@profiling.profile()
+@cache.answers()
+def answers(path: str) -> tuple[int, int]:
+    """Return the answers to both parts."""
+    return (
+        raster.overlaps(raster.load_segments(path)),
+        raster.overlaps(raster.load_segments(path, use_diagonals=True)),
+    )
+
 
+@profiling.profile()
 def solve(lines: list[Line]) -> int:
     """Return the number of overlapping points."""
     diagram = make_diagram(lines)
@@ -28,28 +53,26 @@ def solve(lines: list[Line]) -> int:
     return len(diagram[diagram > 1])
 
 
+@profiling.profile()
 def make_diagram(lines: list[Line]) -> np.ndarray:
     """Return a square matrix initialized with zeros."""
     size = np.concatenate([np.array(a).flatten() for a in lines]).max()
     return np.zeros(shape=[size + 1] * 2, dtype=int)
 
 
+@profiling.profile()
 def load(path: str, use_diagonals: bool = False) -> list[Line]:
     """Return a list of lines comprised of points."""
 
     def load_lazy() -> Iterator:
-        with open(path, encoding="utf-8") as file:
-            for line in file:
-                x1, y1, x2, y2 = np.fromstring(
-                    line.replace("->", ","), dtype=int, sep=","
-                )
-                if x1 == x2:
-                    yield vertical(x1, y1, y2)
-                elif y1 == y2:
-                    yield horizontal(y1, x1, x2)
-                elif abs(x2 - x1) == (abs(y2 - y1)):
-                    if use_diagonals:
-                        yield diagonal(x1, y1, x2, y2)
+        for x1, y1, x2, y2 in fastio.records(fastio.read(path), fields=4):
+            if x1 == x2:
+                yield vertical(x1, y1, y2)
+            elif y1 == y2:
+                yield horizontal(y1, x1, x2)
+            elif abs(x2 - x1) == (abs(y2 - y1)):
+                if use_diagonals:
+                    yield diagonal(x1, y1, x2, y2)
 
     return list(load_lazy())
 
@@ -0,0 +1,189 @@
+"""
+Analytic overlap counting for vent maps with arbitrarily large coordinates.
+
+Every segment lies on a line a*x + b*y = key of one of four orientations, and
+covers an interval of a parameter t along that line (y for vertical lines and
+x for the others). A point is covered at least twice if it is either:
+
+1. Covered by two collinear segments, which a sweep over the sorted interval
+   endpoints of each line finds without visiting individual points.
+2. A crossing of two lines with different orientations, which is computed
+   from pairs of covered intervals whose keys can possibly meet.
+
+Crossings that also belong to the first category are only counted once.
+"""
+
+from typing import Iterator, TypeAlias
+
+import numpy as np
+
+HORIZONTAL, VERTICAL, DIAGONAL, ANTIDIAGONAL = range(4)
+
+# Coefficients of the line equation a*x + b*y = key indexed by orientation
+A = np.array([0, 1, 1, 1])
+B = np.array([1, 0, -1, 1])
+
+MAX_PAIRS = 1 << 22  # Candidate pairs of intervals examined at a time
+
+Intervals: TypeAlias = tuple[np.ndarray, np.ndarray, np.ndarray]  # key, lo, hi
+
+
+def overlaps(segments: np.ndarray) -> int:
+    """Return the number of points where at least two segments overlap."""
+    if len(segments) == 0:
+        return 0
+    lines = classify(segments)
+    covered = sweep(*lines, depth=1)
+    doubled = sweep(*lines, depth=2)
+    xs, ys = crossings(covered)
+    multiplicity = sum(contains(doubled[o], o, xs, ys) for o in range(4))
+    return int(
+        sum((hi - lo + 1).sum() for _, lo, hi in doubled)
+        + np.count_nonzero(multiplicity == 0)
+        - (multiplicity - 1).clip(min=0).sum()
+    )
+
+
+def classify(segments: np.ndarray) -> tuple[np.ndarray, ...]:
+    """Return orientations, line keys, and parameter intervals of segments."""
+    x1, y1, x2, y2 = segments.T.astype(np.int64)
+    orientations = np.select(
+        [x1 == x2, y1 == y2, x2 - x1 == y2 - y1],
+        [VERTICAL, HORIZONTAL, DIAGONAL],
+        ANTIDIAGONAL,
+    )
+    keys = A[orientations] * x1 + B[orientations] * y1
+    t1, t2 = parameter(orientations, x1, y1), parameter(orientations, x2, y2)
+    return orientations, keys, np.minimum(t1, t2), np.maximum(t1, t2)
+
+
+def parameter(orientation, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Return the position of points along lines of the given orientation."""
+    return np.where(orientation == VERTICAL, y, x)
+
+
+def sweep(orientations, keys, los, his, depth: int) -> list[Intervals]:
+    """Return intervals covered at least depth times for each orientation.
+
+    Each segment contributes +1 at its start and -1 past its end. Once these
+    events are sorted by line and position, their running total tells how many
+    segments cover the stretch up to the next event. Coverage only drops to
+    zero at the end of a line, so a covered stretch never spans two lines.
+
+    The resulting intervals are disjoint and sorted by key and lo.
+    """
+    _, lines = np.unique(
+        np.column_stack([orientations, keys]), axis=0, return_inverse=True
+    )
+    lines = np.concatenate([lines.ravel()] * 2)
+    owners = np.concatenate([np.arange(len(keys))] * 2)
+    positions = np.concatenate([los, his + 1])
+    deltas = np.concatenate([np.ones_like(los), -np.ones_like(his)])
+
+    events = np.lexsort((positions, lines))
+    lines, owners, positions = lines[events], owners[events], positions[events]
+    coverage = np.cumsum(deltas[events])
+
+    selected = np.flatnonzero(coverage[:-1] >= depth)
+    selected = selected[positions[selected + 1] > positions[selected]]
+    starts, ends = positions[selected], positions[selected + 1] - 1
+
+    # Merge adjacent stretches of the same line
+    first = np.ones(len(selected), dtype=bool)
+    first[1:] = (lines[selected[1:]] != lines[selected[:-1]]) | (
+        starts[1:] > ends[:-1] + 1
+    )
+    last = np.roll(first, -1)  # The last stretch always ends a run
+    owners = owners[selected[first]]
+    starts, ends = starts[first], ends[last]
+
+    return [
+        (keys[owners][mask], starts[mask], ends[mask])
+        for mask in (orientations[owners] == o for o in range(4))
+    ]
+
+
+def crossings(intervals: list[Intervals]) -> tuple[np.ndarray, np.ndarray]:
+    """Return unique integer points where intervals of distinct lines cross."""
+    points = [np.empty((0, 2), dtype=np.int64)]
+    for o1 in range(4):
+        for o2 in range(o1 + 1, 4):
+            points.extend(_crossings(o1, intervals[o1], o2, intervals[o2]))
+    points = np.unique(np.concatenate(points), axis=0)
+    return points[:, 0], points[:, 1]
+
+
+def _crossings(
+    o1: int, intervals1: Intervals, o2: int, intervals2: Intervals
+) -> Iterator[np.ndarray]:
+    """Return an iterator of arrays of crossing points of two orientations.
+
+    Solving both line equations with Cramer's rule, the parameter of the
+    crossing along the first line is t1 = (alpha*k1 + beta*k2) / det. Keeping
+    t1 within the first interval bounds the keys k2 worth looking at among
+    the second intervals, which are sorted by key.
+    """
+    (k1, lo1, hi1), (k2, lo2, hi2) = intervals1, intervals2
+    a1, b1, a2, b2 = A[o1], B[o1], A[o2], B[o2]
+    det = a1 * b2 - a2 * b1
+    alpha, beta = (-a2, a1) if o1 == VERTICAL else (b2, -b1)
+
+    lower, upper = lo1 * det - alpha * k1, hi1 * det - alpha * k1
+    if det < 0:
+        lower, upper = upper, lower
+    if beta < 0:
+        lower, upper = -upper, -lower
+    begin = np.searchsorted(k2, lower, side="left")
+    counts = np.searchsorted(k2, upper, side="right") - begin
+
+    for rows in _chunks(counts, MAX_PAIRS):
+        i = np.repeat(rows, counts[rows])
+        j = (
+            begin[i]
+            + np.arange(len(i))
+            - np.repeat(np.cumsum(counts[rows]) - counts[rows], counts[rows])
+        )
+        x_numerator = k1[i] * b2 - k2[j] * b1
+        y_numerator = a1 * k2[j] - a2 * k1[i]
+        x, y = x_numerator // det, y_numerator // det
+        t1, t2 = parameter(o1, x, y), parameter(o2, x, y)
+        valid = (
+            (x_numerator % det == 0)
+            & (y_numerator % det == 0)
+            & (lo1[i] <= t1)
+            & (t1 <= hi1[i])
+            & (lo2[j] <= t2)
+            & (t2 <= hi2[j])
+        )
+        yield np.column_stack([x[valid], y[valid]])
+
+
+def _chunks(counts: np.ndarray, limit: int) -> Iterator[np.ndarray]:
+    """Return an iterator of consecutive row indices with bounded total counts."""
+    batches = (np.cumsum(counts) - counts) // limit
+    boundaries = np.flatnonzero(np.diff(batches)) + 1
+    yield from np.split(np.arange(len(counts)), boundaries)
+
+
+def contains(intervals: Intervals, orientation: int, xs, ys) -> np.ndarray:
+    """Return a mask of points lying within any of the intervals.
+
+    Intervals and points are encoded as single numbers ordered first by key
+    and then by the parameter, so that one binary search finds the interval
+    starting closest before each point.
+    """
+    keys, los, his = intervals
+    if len(keys) == 0 or len(xs) == 0:
+        return np.zeros(len(xs), dtype=bool)
+    point_keys = A[orientation] * xs + B[orientation] * ys
+    ts = parameter(orientation, xs, ys)
+
+    key_min = min(keys.min(), point_keys.min())
+    t_min = min(los.min(), ts.min())
+    span = max(his.max(), ts.max()) - t_min + 1
+    codes = (keys - key_min) * span + (los - t_min)
+    point_codes = (point_keys - key_min) * span + (ts - t_min)
+
+    index = np.searchsorted(codes, point_codes, side="right") - 1
+    safe = index.clip(min=0)
+    return (index >= 0) & (keys[safe] == point_keys) & (ts <= his[safe])
@@ -0,0 +1,111 @@
+"""
+Lanternfish population modelled as a histogram of nine timer states.
+
+Every day shifts the histogram down by one timer, while fish with an expired
+timer reset theirs to six and spawn the same number of newborns with timer
+eight. This is a linear map, so it can either be applied day by day or raised
+to a power for very distant horizons.
+"""
+
+from typing import Iterable, Optional, TypeAlias
+
+Matrix: TypeAlias = list[list[int]]
+
+STATES = 9
+RESET, NEWBORN = 6, 8
+MAX_STEPS = 1 << 12  # Longer spans are covered by matrix exponentiation
+
+
+def population(fish: list[int], days: int, modulus: Optional[int] = None) -> int:
+    """Return the total number of fish after the given number of days."""
+    return populations(fish, [days], modulus)[0]
+
+
+def populations(
+    fish: list[int], horizons: Iterable[int], modulus: Optional[int] = None
+) -> list[int]:
+    """Return the total number of fish after each of the given horizons.
+
+    Horizons are visited in ascending order, so that each one continues from
+    the state reached at the previous one.
+    """
+    horizons = list(horizons)
+    totals = {}
+    counts, elapsed = histogram(fish), 0
+    for days in sorted(set(horizons)):
+        counts = advance(counts, days - elapsed, modulus)
+        totals[days], elapsed = _reduce(sum(counts), modulus), days
+    return [totals[days] for days in horizons]
+
+
+def histogram(fish: list[int]) -> list[int]:
+    """Return the number of fish in each timer state."""
+    counts = [0] * STATES
+    for timer in fish:
+        counts[timer] += 1
+    return counts
+
+
+def advance(counts: list[int], days: int, modulus: Optional[int] = None) -> list[int]:
+    """Return the timer histogram after the given number of days."""
+    if days > MAX_STEPS:
+        return jump(counts, days, modulus)
+    return step(counts, days, modulus)
+
+
+def step(counts: list[int], days: int, modulus: Optional[int] = None) -> list[int]:
+    """Return the timer histogram after simulating each day in O(1).
+
+    Instead of shifting the histogram, the index of timer zero rotates, and
+    the expired fish stay in place to become the newborns.
+    """
+    counts = list(counts)
+    for day in range(days):
+        expired = counts[day % STATES]
+        counts[(day + RESET + 1) % STATES] += expired
+        if modulus:
+            counts[(day + RESET + 1) % STATES] %= modulus
+    return [counts[(days + timer) % STATES] for timer in range(STATES)]
+
+
+def jump(counts: list[int], days: int, modulus: Optional[int] = None) -> list[int]:
+    """Return the timer histogram after O(log days) matrix multiplications."""
+    matrix = matrix_power(transition_matrix(), days, modulus)
+    return [_reduce(sum(a * b for a, b in zip(row, counts)), modulus) for row in matrix]
+
+
+def transition_matrix() -> Matrix:
+    """Return a matrix mapping the timer histogram to the next day's one."""
+    matrix = [[0] * STATES for _ in range(STATES)]
+    for timer in range(1, STATES):
+        matrix[timer - 1][timer] = 1
+    matrix[RESET][0] = matrix[NEWBORN][0] = 1
+    return matrix
+
+
+def matrix_power(
+    matrix: Matrix, exponent: int, modulus: Optional[int] = None
+) -> Matrix:
+    """Return the matrix raised to the given power by repeated squaring."""
+    result = [[int(i == j) for j in range(STATES)] for i in range(STATES)]
+    while exponent > 0:
+        if exponent & 1:
+            result = _multiply(result, matrix, modulus)
+        matrix = _multiply(matrix, matrix, modulus)
+        exponent >>= 1
+    return result
+
+
+def _multiply(a: Matrix, b: Matrix, modulus: Optional[int]) -> Matrix:
+    columns = list(zip(*b))
+    return [
+        [
+            _reduce(sum(x * y for x, y in zip(row, column)), modulus)
+            for column in columns
+        ]
+        for row in a
+    ]
+
+
+def _reduce(value: int, modulus: Optional[int]) -> int:
+    return value % modulus if modulus else value
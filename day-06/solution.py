@@ -8,14 +8,30 @@
 
 import sys
 from collections import Counter
-from functools import cache
+from pathlib import Path
+
+from population import population, populations
+
+sys.path.append(str(Path(__file__).parents[1]))
+
+from aoc import cache, fastio, memo, profiling  # noqa: E402
 
 
 def main(fish: list[int]) -> None:
     assert solve(fish, days=80) == 356190
     assert solve(fish, days=256) == 1617359101538
+    assert populations(fish, [80, 256]) == [356190, 1617359101538]
+    assert solve(fish, days=50_000) == population(fish, days=50_000)
+
 
+@profiling.profile()
+@cache.answers()
+def answers(path: str) -> tuple[int, int]:
+    """Return the answers to both parts."""
+    return tuple(populations(load(path), [80, 256]))
 
+
+@profiling.profile()
 def solve(fish: list[int], days: int) -> int:
     """Return the total number of fish after the given number of days."""
     return sum(
@@ -23,20 +39,34 @@ def solve(fish: list[int], days: int) -> int:
     )
 
 
-@cache
+# The recurrence only ever needs the nine latest days, so the ascending fill
+# below never evicts what it's about to use, and maxsize merely caps memory
+@memo.memoize(maxsize=1 << 16)
 def offsprings(days: int) -> int:
-    """Return the number of fish offsprings after the given number of days."""
-    total = 1
-    while days > 0:
-        total += offsprings(days - 9)
-        days = days - 7
-    return total
+    """Return the number of fish offsprings after the given number of days.
+
+    A fish spawns on days - 9, days - 16, and so on, while the same fish seven
+    days earlier spawned all but the first of these, hence the recurrence.
+    Missing earlier days are filled in ascending order from the latest cached
+    one, which keeps the recursion one level deep for any horizon.
+    """
+    if days <= 0:
+        return 1
+    latest = days - 7
+    while latest > 0 and not offsprings.cached(latest):
+        latest -= 1
+    offsprings.warm_up(range(latest + 1, days - 6))
+    return offsprings(days - 7) + offsprings(days - 9)
+
+
+profiling.track_cache("offsprings", offsprings)
 
 
+@profiling.profile()
 def load(path: str) -> list[int]:
     """Return a list of fish' initial states."""
-    with open(path, encoding="utf-8") as file:
-        return list(map(int, file.readline().split(",")))
+    first_line, _ = fastio.split_line(fastio.read(path))
+    return fastio.integers(first_line).tolist()
 
 
 if __name__ == "__main__":
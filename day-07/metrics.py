@@ -0,0 +1,159 @@
+"""
+Registry of fuel cost metrics with vectorized kernels and minimizers.
+
+A metric maps distances between crabs and a candidate position to fuel costs.
+Its optional minimizer narrows down the optimal position to a few candidates
+in closed form. Otherwise, convex metrics fall back to a ternary search and
+the remaining ones to scanning every position between the extreme crabs.
+
+Usage:
+@register("cubic")
+def cubic(distances: np.ndarray) -> np.ndarray:
+    return distances**3
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Optional, TypeAlias
+
+import numpy as np
+
+Kernel: TypeAlias = Callable[[np.ndarray], np.ndarray]
+Minimizer: TypeAlias = Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+CHUNK_SIZE = 1 << 20  # Number of (candidate, position) pairs scored at a time
+
+
+@dataclass(frozen=True)
+class Metric:
+    name: str
+    kernel: Kernel
+    minimizer: Optional[Minimizer] = None
+    convex: bool = True
+
+
+METRICS: dict[str, Metric] = {}
+
+
+def register(
+    name: str, minimizer: Optional[Minimizer] = None, convex: bool = True
+) -> Callable[[Kernel], Kernel]:
+    """Return a decorator adding a cost kernel to the registry."""
+
+    def decorator(kernel: Kernel) -> Kernel:
+        METRICS[name] = Metric(name, kernel, minimizer, convex)
+        return kernel
+
+    return decorator
+
+
+def weighted_median(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Return the lowest position with at least half of the total weight."""
+    cumulative = np.cumsum(weights)
+    return values[[np.searchsorted(cumulative, cumulative[-1] / 2)]]
+
+
+def around_mean(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Return integers at most one unit away from the floored weighted mean."""
+    mean = int(np.floor(np.dot(values, weights) / weights.sum()))
+    return np.arange(mean - 1, mean + 2)
+
+
+@register("linear", minimizer=weighted_median)
+def linear(distances: np.ndarray) -> np.ndarray:
+    return distances
+
+
+@register("triangular", minimizer=around_mean)
+def triangular(distances: np.ndarray) -> np.ndarray:
+    return distances * (distances + 1) // 2
+
+
+@register("quadratic", minimizer=around_mean)
+def quadratic(distances: np.ndarray) -> np.ndarray:
+    return distances * distances
+
+
+def capped(limit: int) -> Metric:
+    """Return a registered metric whose cost stops growing past the limit."""
+
+    def kernel(distances: np.ndarray) -> np.ndarray:
+        return np.minimum(distances, limit)
+
+    register(f"capped-{limit}", convex=False)(kernel)
+    return METRICS[f"capped-{limit}"]
+
+
+def costs(
+    positions: np.ndarray,
+    candidates: np.ndarray,
+    metric: Metric | str,
+    weights: Optional[np.ndarray] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> np.ndarray:
+    """Return the total cost of moving all crabs to each candidate position.
+
+    Crabs sharing a position are merged into one with their weights summed,
+    and the pairs of candidates and positions are scored in blocks of at
+    most chunk_size, so the full matrix never gets allocated.
+    """
+    metric = METRICS[metric] if isinstance(metric, str) else metric
+    values, weights = _compress(positions, weights)
+    candidates = np.asarray(candidates, dtype=np.int64)
+    totals = np.zeros(len(candidates), dtype=np.result_type(weights, np.int64))
+    columns = max(1, min(len(values), chunk_size))
+    rows = max(1, chunk_size // columns)
+    for j in range(0, len(values), columns):
+        block_values, block_weights = values[j : j + columns], weights[j : j + columns]
+        for i in range(0, len(candidates), rows):
+            distances = np.abs(candidates[i : i + rows, np.newaxis] - block_values)
+            totals[i : i + rows] += metric.kernel(distances) @ block_weights
+    return totals
+
+
+def minimize(
+    positions: np.ndarray, metric: Metric | str, weights: Optional[np.ndarray] = None
+) -> tuple[int, int | float]:
+    """Return the optimal position and its total cost."""
+    metric = METRICS[metric] if isinstance(metric, str) else metric
+    values, weights = _compress(positions, weights)
+    if metric.minimizer:
+        candidates = metric.minimizer(values, weights)
+    elif metric.convex:
+        candidates = _ternary_search(values, weights, metric)
+    else:
+        candidates = np.arange(values[0], values[-1] + 1)
+    totals = costs(values, candidates, metric, weights)
+    best = int(np.argmin(totals))
+    return int(candidates[best]), totals[best].item()
+
+
+def _ternary_search(
+    values: np.ndarray, weights: np.ndarray, metric: Metric
+) -> np.ndarray:
+    """Return at most three candidates bracketing the minimum of a convex cost."""
+    lo, hi = int(values[0]), int(values[-1])
+    while hi - lo > 2:
+        third = (hi - lo) // 3
+        cost1, cost2 = costs(values, [lo + third, hi - third], metric, weights)
+        if cost1 < cost2:
+            hi = hi - third - 1
+        elif cost1 > cost2:
+            lo = lo + third + 1
+        else:
+            lo, hi = lo + third, hi - third
+    return np.arange(lo, hi + 1)
+
+
+def _compress(
+    positions: np.ndarray, weights: Optional[np.ndarray]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return sorted unique positions and their total weights."""
+    positions = np.asarray(positions, dtype=np.int64)
+    if weights is None:
+        values, counts = np.unique(positions, return_counts=True)
+        return values, counts.astype(np.int64)
+    weights = np.asarray(weights)
+    values, inverse = np.unique(positions, return_inverse=True)
+    totals = np.zeros(len(values), dtype=np.result_type(weights, np.int64))
+    np.add.at(totals, inverse.ravel(), weights)
+    return values, totals
@@ -0,0 +1,80 @@
+"""
+Exact fuel cost minimization using a histogram of crab positions.
+
+With prefix counts and prefix sums of positions, the total linear distance
+to any candidate position is available in O(1). The triangular cost of a
+distance d is (d^2 + d) / 2, whose sum additionally needs the sum of squared
+distances, and that only depends on global totals.
+"""
+
+import numpy as np
+
+
+class CrabOptimizer:
+    @classmethod
+    def from_file(cls, path: str) -> "CrabOptimizer":
+        with open(path, encoding="utf-8") as file:
+            return cls(np.fromstring(file.read(), dtype=np.int64, sep=","))
+
+    def __init__(self, positions: np.ndarray) -> None:
+        positions = np.asarray(positions, dtype=np.int64)
+        self.lowest, self.highest = int(positions.min()), int(positions.max())
+        counts = np.bincount(positions - self.lowest)
+        values = np.arange(self.lowest, self.highest + 1, dtype=np.int64)
+        self.count_prefix = np.cumsum(counts)  # Number of crabs at or below
+        self.sum_prefix = np.cumsum(counts * values)  # Their positions summed
+        self.count = int(self.count_prefix[-1])
+        self.total = int(self.sum_prefix[-1])
+        self.total_squares = int((counts * values**2).sum())
+
+    def linear_cost(self, x: int) -> int:
+        """Return the total fuel spent when each step costs one unit."""
+        below, below_sum = self._prefix(x)
+        above, above_sum = self.count - below, self.total - below_sum
+        return x * below - below_sum + above_sum - x * above
+
+    def triangular_cost(self, x: int) -> int:
+        """Return the total fuel spent when each next step costs one more."""
+        squares = self.total_squares - 2 * x * self.total + self.count * x * x
+        return (squares + self.linear_cost(x)) // 2
+
+    def linear_costs(self) -> np.ndarray:
+        """Return linear costs of all positions between the extreme crabs."""
+        x = np.arange(self.lowest, self.highest + 1, dtype=np.int64)
+        below, below_sum = self.count_prefix, self.sum_prefix
+        return x * (2 * below - self.count) - 2 * below_sum + self.total
+
+    def triangular_costs(self) -> np.ndarray:
+        """Return triangular costs of all positions between the extreme crabs."""
+        x = np.arange(self.lowest, self.highest + 1, dtype=np.int64)
+        squares = self.total_squares - 2 * x * self.total + self.count * x * x
+        return (squares + self.linear_costs()) // 2
+
+    def optimize_linear(self) -> tuple[int, int]:
+        """Return the optimal position and its linear cost.
+
+        Any median minimizes the sum of absolute distances.
+        """
+        rank = (self.count - 1) // 2 + 1
+        x = self.lowest + int(np.searchsorted(self.count_prefix, rank))
+        return x, self.linear_cost(x)
+
+    def optimize_triangular(self) -> tuple[int, int]:
+        """Return the optimal position and its triangular cost.
+
+        The derivative of the continuous cost, n*x - sum + (below - above)/2,
+        vanishes within half a unit from the mean, so the optimal integer
+        position is at most one unit away from the mean rounded down.
+        """
+        mean = self.total // self.count
+        return min(
+            ((x, self.triangular_cost(x)) for x in range(mean - 1, mean + 2)),
+            key=lambda candidate: candidate[1],
+        )
+
+    def _prefix(self, x: int) -> tuple[int, int]:
+        """Return the number and sum of positions at or below x."""
+        if x < self.lowest:
+            return 0, 0
+        index = min(x, self.highest) - self.lowest
+        return int(self.count_prefix[index]), int(self.sum_prefix[index])
@@ -7,40 +7,53 @@
 # """
 
 import sys
-from statistics import median, mean
-from typing import Callable, TypeAlias
+from pathlib import Path
 
-MetricFunction: TypeAlias = Callable[[list[int]], int]
+from metrics import minimize
+from optimizer import CrabOptimizer
+
+sys.path.append(str(Path(__file__).parents[1]))
+
+from aoc import cache, fastio, profiling  # noqa: E402
 
 
 def main(positions: list[int]) -> None:
     assert part1(positions) == 349357
     assert part2(positions) == 96708205
 
+    optimizer = CrabOptimizer(positions)
+    assert optimizer.optimize_linear()[1] == 349357
+    assert optimizer.optimize_triangular()[1] == 96708205
 
-def part1(positions: list[int]) -> int:
-    return sum(distances(positions, median))
+    assert minimize(positions, "linear")[1] == 349357
+    assert minimize(positions, "triangular")[1] == 96708205
 
 
-def part2(positions: list[int]) -> int:
-    return sum(cost(x) for x in distances(positions, mean))
+@profiling.profile()
+@cache.answers()
+def answers(path: str) -> tuple[int, int]:
+    """Return the answers to both parts."""
+    positions = load(path)
+    return minimize(positions, "linear")[1], minimize(positions, "triangular")[1]
 
 
-def distances(positions: list[int], metric: MetricFunction) -> list[int]:
-    """Return a list of distances to the average position."""
-    x0 = int(metric(positions))  # FIXME Should round() instead?
-    return [abs(x - x0) for x in positions]
+@profiling.profile()
+def part1(positions: list[int]) -> int:
+    """Return the least fuel spent moving one unit per step."""
+    return CrabOptimizer(positions).optimize_linear()[1]
 
 
-def cost(n: int) -> int:
-    """Return the sum of arithmetic progression [1 + 2 + ... + n]."""
-    return n * (n + 1) // 2
+@profiling.profile()
+def part2(positions: list[int]) -> int:
+    """Return the least fuel spent moving n units for the n-th step."""
+    return CrabOptimizer(positions).optimize_triangular()[1]
 
 
+@profiling.profile()
 def load(path: str) -> list[int]:
     """Return a list of crabs' horizontal positions."""
-    with open(path, encoding="utf-8") as file:
-        return list(map(int, file.readline().split(",")))
+    first_line, _ = fastio.split_line(fastio.read(path))
+    return fastio.integers(first_line).tolist()
 
 
 if __name__ == "__main__":
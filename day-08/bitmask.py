@@ -0,0 +1,69 @@
+"""
+Seven-segment decoding with bitmasks and order-invariant digit signatures.
+
+Each segment appears in a fixed number of the ten digits regardless of the
+wiring, e.g. segment "e" lights up in four digits only. Summing these
+frequencies over the segments of a digit gives a signature unique to each
+digit, which can be looked up in a table precomputed for the correct wiring.
+"""
+
+SEGMENTS = "abcdefg"
+DIGITS = "abcefg cf acdeg acdfg bcdf abdfg abdefg acf abcdefg abcdfg".split()
+BITS = {segment: 1 << i for i, segment in enumerate(SEGMENTS)}
+
+
+def signature(patterns: str, pattern: str) -> int:
+    """Return the sum of frequencies of the pattern's segments in patterns."""
+    return sum(patterns.count(segment) for segment in pattern)
+
+
+SIGNATURES = {
+    signature(" ".join(DIGITS), pattern): digit for digit, pattern in enumerate(DIGITS)
+}
+
+
+def decode(pattern_line: str, output_line: str) -> int:
+    """Return the output value using a lookup of digit signatures."""
+    frequencies = {segment: pattern_line.count(segment) for segment in SEGMENTS}
+    number = 0
+    for pattern in output_line.split():
+        digit = SIGNATURES[sum(frequencies[segment] for segment in pattern)]
+        number = number * 10 + digit
+    return number
+
+
+def encode(pattern: str) -> int:
+    """Return a 7-bit mask of the segments lit in a pattern."""
+    mask = 0
+    for segment in pattern:
+        mask |= BITS[segment]
+    return mask
+
+
+def deduce(masks: list[int]) -> dict[int, int]:
+    """Return the mapping of ten unique pattern masks to decimal digits."""
+    by_length = {}
+    for mask in masks:
+        by_length.setdefault(mask.bit_count(), []).append(mask)
+
+    (one,), (seven,), (four,), (eight,) = (by_length[n] for n in (2, 3, 4, 7))
+    two_three_five, zero_six_nine = by_length[5], by_length[6]
+
+    three = next(m for m in two_three_five if m & one == one)
+    nine = next(m for m in zero_six_nine if m & four == four)
+    five = next(m for m in two_three_five if m | one == nine)
+    two = next(m for m in two_three_five if m not in (three, five))
+    six = next(m for m in zero_six_nine if m != nine and m & five == five)
+    zero = next(m for m in zero_six_nine if m not in (six, nine))
+
+    digits = [zero, one, two, three, four, five, six, seven, eight, nine]
+    return {mask: digit for digit, mask in enumerate(digits)}
+
+
+def output_value(pattern_line: str, output_line: str) -> int:
+    """Return the output value using bitwise subset tests."""
+    mapping = deduce([encode(pattern) for pattern in pattern_line.split()])
+    number = 0
+    for pattern in output_line.split():
+        number = number * 10 + mapping[encode(pattern)]
+    return number
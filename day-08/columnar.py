@@ -0,0 +1,87 @@
+"""
+Columnar parsing and decoding of seven-segment display readings.
+
+The whole input is turned into a (rows x 14) matrix of 7-bit pattern masks,
+ten unique patterns followed by four output patterns per reading, without
+creating any Python strings. Both parts are then computed with array-wide
+operations, and large files are split across a pool of processes.
+"""
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TypeAlias
+
+import numpy as np
+
+from bitmask import SIGNATURES
+
+sys.path.append(str(Path(__file__).parents[1]))
+
+from aoc import fastio  # noqa: E402
+
+Chunk: TypeAlias = fastio.ByteRange
+
+POPCOUNT = np.array([bin(mask).count("1") for mask in range(128)], dtype=np.uint8)
+DIGITS = np.zeros(max(SIGNATURES) + 1, dtype=np.int64)
+DIGITS[list(SIGNATURES)] = list(SIGNATURES.values())
+PLACES = np.array([1000, 100, 10, 1])
+
+CHUNK_BYTES = 1 << 26  # Upper bound on the input parsed by a worker at once
+
+
+def load(path: str) -> np.ndarray:
+    """Return a matrix of pattern masks with one row per reading."""
+    return parse(np.fromfile(path, dtype=np.uint8))
+
+
+def from_text(text: str) -> np.ndarray:
+    """Return a matrix of pattern masks with one row per line of text."""
+    return parse(np.frombuffer(text.encode("ascii"), dtype=np.uint8))
+
+
+def parse(buffer: np.ndarray) -> np.ndarray:
+    """Return a matrix of pattern masks parsed from raw bytes."""
+    letters = (buffer >= ord("a")) & (buffer <= ord("g"))
+    starts = letters.copy()
+    starts[1:] &= ~letters[:-1]
+    bits = np.left_shift(1, buffer[letters] - ord("a"), dtype=np.uint8)
+    if len(bits) == 0:
+        return np.empty((0, 14), dtype=np.uint8)
+    masks = np.bitwise_or.reduceat(bits, np.flatnonzero(starts[letters]))
+    return masks.reshape(-1, 14)
+
+
+def count_1_4_7_8(masks: np.ndarray) -> int:
+    """Return the total number of digits 1, 4, 7, or 8 in the output."""
+    return int(np.isin(POPCOUNT[masks[:, 10:]], [2, 4, 3, 7]).sum())
+
+
+def output_values(masks: np.ndarray) -> np.ndarray:
+    """Return the output values of all readings decoded by digit signatures."""
+    bits = (masks[..., np.newaxis] >> np.arange(7, dtype=np.uint8)) & 1
+    frequencies = bits[:, :10].sum(axis=1, dtype=np.int64)
+    signatures = (bits[:, 10:] * frequencies[:, np.newaxis, :]).sum(axis=2)
+    return DIGITS[signatures] @ PLACES
+
+
+def solve(path: str, workers: int | None = None) -> tuple[int, int]:
+    """Return both parts computed over chunks of the file in parallel."""
+    workers = workers or os.cpu_count() or 1
+    count = max(workers, os.path.getsize(path) // CHUNK_BYTES + 1)
+    tasks = fastio.line_ranges(path, count)
+    if workers == 1:
+        results = list(map(summarize, tasks))
+    else:
+        with ProcessPoolExecutor(workers) as executor:
+            results = list(executor.map(summarize, tasks))
+    return sum(part1 for part1, _ in results), sum(part2 for _, part2 in results)
+
+
+def summarize(chunk: Chunk) -> tuple[int, int]:
+    """Return partial sums of both parts for a memory-mapped byte range."""
+    path, start, end = chunk
+    buffer = np.memmap(path, dtype=np.uint8, mode="r", offset=start, shape=end - start)
+    masks = parse(buffer)
+    return count_1_4_7_8(masks), int(output_values(masks).sum())
@@ -10,8 +10,18 @@ import sys
 from collections import UserDict
 from dataclasses import dataclass
 from functools import cached_property
+from pathlib import Path
 from typing import TypeAlias
 
+import numpy as np
+
+import bitmask
+import columnar
+
+sys.path.append(str(Path(__file__).parents[1]))
+
+from aoc import cache, profiling  # noqa: E402
+
 Pattern: TypeAlias = frozenset[str]
 Mapping: TypeAlias = [int | Pattern]
 
@@ -46,12 +56,36 @@ def main(readings: list[Reading]) -> None:
     assert part1(readings) == 245
     assert part2(readings) == 983026
 
+    lines = [(reading.pattern_line, reading.output_line) for reading in readings]
+    assert sum(bitmask.decode(*line) for line in lines) == 983026
+    assert sum(bitmask.output_value(*line) for line in lines) == 983026
+
+    masks = columnar.from_text("\n".join(" | ".join(line) for line in lines))
+    assert columnar.count_1_4_7_8(masks) == 245
+    assert columnar.output_values(masks).sum() == 983026
+
+
+@profiling.profile()
+@cache.answers()
+def answers(path: str) -> tuple[int, int]:
+    """Return the answers to both parts."""
+    masks = load_masks(path)
+    return columnar.count_1_4_7_8(masks), int(columnar.output_values(masks).sum())
+
+
+@cache.arrays()
+def load_masks(path: str) -> np.ndarray:
+    """Return a matrix of pattern masks with one row per reading."""
+    return columnar.load(path)
+
 
+@profiling.profile()
 def part1(readings: list[Reading]) -> int:
     """Return the total number of digits 1, 4, 7, or 8 in the output."""
     return sum(map(count_1_4_7_8, readings))
 
 
+@profiling.profile()
 def part2(readings: list[Reading]) -> int:
     """Return the sum of the output values."""
     return sum(map(output_value, readings))
@@ -68,6 +102,7 @@ def output_value(reading: Reading) -> int:
     return make_number(translate(reading.patterns), reading.output)
 
 
+@profiling.profile()
 def translate(patterns: list[Pattern]) -> BidirectionalMap[Pattern, int]:
     """Return the mapping of ten unique patterns to decimal digits."""
 
@@ -108,6 +143,7 @@ def make_number(mapping: BidirectionalMap[Pattern, int], output: list[Pattern])
     return sum(mapping[p] * 10 ** i for i, p in enumerate(reversed(output)))
 
 
+@profiling.profile()
 def load(path: str) -> list[Reading]:
     """Return a list of seven-segment display signal readings."""
     with open(path, encoding="utf-8") as file:
@@ -0,0 +1,89 @@
+"""
+Vectorized low points and connected-component labelling of basins.
+
+Basins are the connected regions of heights below nine. Instead of flood
+filling cell by cell, each row is split into runs of consecutive basin cells,
+runs overlapping between adjacent rows are linked, and linked runs are merged
+with a vectorized union-find.
+"""
+
+import numpy as np
+
+PEAK = 9
+
+
+def low_points(values: np.ndarray) -> np.ndarray:
+    """Return a mask of points lower than all their neighbours."""
+    padded = np.pad(values, 1, constant_values=np.iinfo(values.dtype).max)
+    center = padded[1:-1, 1:-1]
+    return (
+        (center < padded[:-2, 1:-1])
+        & (center < padded[2:, 1:-1])
+        & (center < padded[1:-1, :-2])
+        & (center < padded[1:-1, 2:])
+    )
+
+
+def risk_levels(values: np.ndarray) -> np.ndarray:
+    """Return an array of risk levels associated with the low points."""
+    return values[low_points(values)].astype(np.int64) + 1
+
+
+def label(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return basin labels of all cells (zero outside) and basin sizes.
+
+    The size of the basin labelled n is at index n - 1.
+    """
+    height, width = values.shape
+    rows, starts, ends = runs(values < PEAK)
+
+    # Runs sorted in row-major order, so keys of starts and ends are monotonic
+    start_keys, end_keys = rows * (width + 1) + starts, rows * (width + 1) + ends
+    above = (rows - 1) * (width + 1)
+    first = np.searchsorted(end_keys, above + starts, side="right")
+    last = np.searchsorted(start_keys, above + ends, side="left")
+    counts = np.maximum(last - first, 0)
+    lower = np.repeat(np.arange(len(rows)), counts)
+    upper = (
+        first[lower]
+        + np.arange(len(lower))
+        - np.repeat(np.cumsum(counts) - counts, counts)
+    )
+
+    roots = union_find(len(rows), lower, upper)
+    _, run_labels = np.unique(roots, return_inverse=True)
+    run_labels = run_labels.ravel() + 1
+    lengths = ends - starts
+
+    labels = np.zeros(height * width, dtype=np.int32)
+    labels[np.flatnonzero(values < PEAK)] = np.repeat(run_labels, lengths)
+    sizes = np.bincount(run_labels, weights=lengths)[1:].astype(np.int64)
+    return labels.reshape(height, width), sizes
+
+
+def runs(mask: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return rows, starts, and exclusive ends of horizontal runs of True."""
+    padded = np.pad(mask.astype(np.int8), ((0, 0), (1, 1)))
+    edges = np.diff(padded, axis=1)
+    rows, starts = np.nonzero(edges == 1)
+    _, ends = np.nonzero(edges == -1)
+    return rows, starts, ends
+
+
+def union_find(size: int, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Return the root of each element after merging the pairs (a, b).
+
+    Every round hooks the larger of each pair's roots onto the smaller one,
+    and then compresses all paths by pointer jumping until every element
+    points directly at its root.
+    """
+    parents = np.arange(size)
+    while True:
+        root_a, root_b = parents[a], parents[b]
+        if np.array_equal(root_a, root_b):
+            return parents
+        lowest = np.minimum(root_a, root_b)
+        np.minimum.at(parents, root_a, lowest)
+        np.minimum.at(parents, root_b, lowest)
+        while not np.array_equal(grandparents := parents[parents], parents):
+            parents = grandparents
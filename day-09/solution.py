@@ -8,21 +8,29 @@
 
 import sys
 from math import prod as product
+from pathlib import Path
 from typing import TypeAlias, Iterator
 
 import numpy as np
 
+import labelling
+import tiles
+
+sys.path.append(str(Path(__file__).parents[1]))
+
+from aoc import cache, fastio, profiling  # noqa: E402
+
 Point: TypeAlias = tuple[int, int]
 
 
 class HeightMap:
     @classmethod
+    @profiling.profile()
     def from_file(cls, path: str) -> "HeightMap":
-        with open(path, encoding="utf-8") as file:
-            return cls([list(map(int, line.strip())) for line in file])
+        return cls(load_heights(path))
 
-    def __init__(self, values: list[list[int]]) -> None:
-        self.values = np.array(values)
+    def __init__(self, values: list[list[int]] | np.ndarray) -> None:
+        self.values = np.array(values, dtype=int)
         self.height, self.width = self.values.shape
 
     def __getitem__(self, yx: Point) -> int:
@@ -70,20 +78,45 @@ class HeightMap:
             yield y, x + 1
 
 
-def main(height_map: HeightMap) -> None:
+def main(height_map: HeightMap, path: str) -> None:
     assert part1(height_map) == 541
     assert part2(height_map) == 847504
 
+    assert labelling.risk_levels(height_map.values).sum() == 541
+    _, sizes = labelling.label(height_map.values)
+    assert product(np.sort(sizes)[-3:]) == 847504
+
+    risk_level, sizes = tiles.solve(path, tile_rows=10)
+    assert risk_level == 541
+    assert product(np.sort(sizes)[-3:]) == 847504
+
+
+@profiling.profile()
+@cache.answers()
+def answers(path: str) -> tuple[int, int]:
+    """Return the answers to both parts."""
+    risk_level, sizes = tiles.solve(path, workers=1)
+    return risk_level, int(product(np.sort(sizes)[-3:]))
+
+
+@cache.arrays()
+def load_heights(path: str) -> np.ndarray:
+    """Return a (rows x columns) matrix of single-digit heights."""
+    return fastio.digit_grid(fastio.read(path))
+
 
+@profiling.profile()
 def part1(height_map: HeightMap) -> int:
     """Return the total risk level."""
     return sum(height_map.risk_levels)
 
 
+@profiling.profile()
 def part2(height_map: HeightMap) -> int:
     """Return the product of the three largest basin sizes."""
     return product(sorted(height_map.basin_sizes, reverse=True)[:3])
 
 
 if __name__ == "__main__":
-    main(HeightMap.from_file(sys.argv[1] if len(sys.argv) > 1 else "input.txt"))
+    path = sys.argv[1] if len(sys.argv) > 1 else "input.txt"
+    main(HeightMap.from_file(path), path)
@@ -0,0 +1,99 @@
+"""
+Out-of-core processing of height maps split into horizontal tiles.
+
+The input file is memory-mapped as a grid of ASCII digits, and each tile of
+rows is processed independently together with one halo row above and below,
+which is enough to tell the low points. Basins are labelled within tiles and
+then merged across tile boundaries by matching labels of the adjacent rows.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+
+from labelling import label, low_points, union_find
+
+TILE_CELLS = 1 << 24  # Upper bound on the number of cells in a tile
+
+
+class Tile(NamedTuple):
+    risk_level: int
+    sizes: np.ndarray
+    first_row: np.ndarray  # Basin labels of the top row
+    last_row: np.ndarray  # Basin labels of the bottom row
+
+
+def open_map(path: str) -> np.ndarray:
+    """Return a read-only (height x width) view of the digits in a file.
+
+    Lines may end with either LF or CRLF, and the last one may have none.
+    """
+    digits = np.memmap(path, dtype=np.uint8, mode="r")
+    width = int(np.argmax(digits == ord("\n"))) or len(digits)
+    stride = width + 1
+    if width > 0 and digits[width - 1] == ord("\r"):
+        width -= 1
+    height = (len(digits) + stride - 1) // stride
+    if height and (height - 1) * stride + width > len(digits):
+        height -= 1  # Trailing bytes shorter than a line, e.g. a final newline
+    return np.lib.stride_tricks.as_strided(
+        digits, shape=(height, width), strides=(stride, 1), writeable=False
+    )
+
+
+def solve(
+    path: str, tile_rows: int | None = None, workers: int | None = None
+) -> tuple[int, np.ndarray]:
+    """Return the total risk level and the sizes of all basins."""
+    height, width = open_map(path).shape
+    tile_rows = tile_rows or max(1, TILE_CELLS // width)
+    tasks = [
+        (path, start, min(start + tile_rows, height))
+        for start in range(0, height, tile_rows)
+    ]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        tiles = list(map(process, tasks))
+    else:
+        with ProcessPoolExecutor(workers) as executor:
+            tiles = list(executor.map(process, tasks))
+    return sum(tile.risk_level for tile in tiles), merge(tiles)
+
+
+def process(task: tuple[str, int, int]) -> Tile:
+    """Return low points and basins found within a tile of rows."""
+    path, start, end = task
+    grid = open_map(path)
+    top, bottom = max(start - 1, 0), min(end + 1, len(grid))
+    values = grid[top:bottom] - ord("0")
+    inner = slice(start - top, end - top)
+
+    lowest = values[inner][low_points(values)[inner]]
+    labels, sizes = label(values[inner])
+    risk_level = int(lowest.sum(dtype=np.int64)) + len(lowest)
+    return Tile(risk_level, sizes, labels[0], labels[-1])
+
+
+def merge(tiles: list[Tile]) -> np.ndarray:
+    """Return sizes of basins after joining those that span several tiles."""
+    counts = [len(tile.sizes) for tile in tiles]
+    offsets = np.cumsum([0] + counts[:-1])
+    a, b = [], []
+    for (upper, offset1), (lower, offset2) in zip(
+        zip(tiles, offsets), zip(tiles[1:], offsets[1:])
+    ):
+        joined = (upper.last_row > 0) & (lower.first_row > 0)
+        pairs = np.unique(
+            np.stack([upper.last_row, lower.first_row])[:, joined], axis=1
+        )
+        a.append(pairs[0] - 1 + offset1)
+        b.append(pairs[1] - 1 + offset2)
+    sizes = np.concatenate([tile.sizes for tile in tiles])
+    if a:
+        roots = union_find(len(sizes), np.concatenate(a), np.concatenate(b))
+    else:
+        roots = np.arange(len(sizes))
+    merged = np.bincount(roots, weights=sizes, minlength=len(sizes))
+    return merged[np.unique(roots)].astype(np.int64)
@@ -0,0 +1,162 @@
+"""
+Push-style parsing of arbitrarily long lines arriving in chunks.
+
+The parser keeps its bracket stack as a compact array of codes and reports
+corruption as soon as the first illegal symbol arrives, together with its
+offset from the beginning of the line. Its state can be saved to bytes and
+restored later, and many lines can be parsed concurrently over asyncio streams.
+"""
+
+import asyncio
+import struct
+from typing import AsyncIterator, Iterable, Optional
+
+from parser import ParsedLine
+from scanner import CLOSING, OPENING, TABLE
+
+CODES = bytes(TABLE[byte] if byte in OPENING + CLOSING else 0 for byte in range(256))
+MISSING = bytes.maketrans(bytes(range(1, 5)), CLOSING)
+
+HEADER = struct.Struct("<qqqB?")  # Offset, depth, corruption, symbol, keep line
+CHUNK_SIZE = 1 << 16
+
+
+class IncrementalParser:
+    """Parser of one line of code fed in chunks of bytes."""
+
+    def __init__(self, keep_line: bool = False, capacity: int = 1 << 12) -> None:
+        self.keep_line = keep_line
+        self.stack = bytearray(capacity)
+        self.depth = 0
+        self.offset = 0
+        self.corrupted_at: Optional[int] = None
+        self.last_symbol: Optional[str] = None
+        self.chunks: list[bytes] = []
+
+    @property
+    def corrupted(self) -> bool:
+        return self.corrupted_at is not None
+
+    def feed(self, chunk: bytes | str) -> Optional[int]:
+        """Consume the next chunk and return the offset of corruption if any."""
+        if isinstance(chunk, str):
+            chunk = chunk.encode("ascii")
+        if self.keep_line:
+            self.chunks.append(chunk)
+        if self.corrupted_at is None:
+            self._consume(chunk)
+        self.offset += len(chunk)
+        return self.corrupted_at
+
+    def finish(self) -> ParsedLine:
+        """Return the parsed line assuming no more data will arrive."""
+        line = b"".join(self.chunks).decode("ascii")
+        if self.corrupted_at is not None:
+            return ParsedLine.corrupted(line, self.last_symbol)
+        if self.depth > 0:
+            missing = self.stack[self.depth - 1 :: -1].translate(MISSING)
+            return ParsedLine.incomplete(line, missing.decode("ascii"))
+        return ParsedLine.okay(line)
+
+    def checkpoint(self) -> bytes:
+        """Return a snapshot of the parser state to resume from later."""
+        corrupted_at = -1 if self.corrupted_at is None else self.corrupted_at
+        symbol = ord(self.last_symbol) if self.last_symbol else 0
+        header = HEADER.pack(
+            self.offset, self.depth, corrupted_at, symbol, self.keep_line
+        )
+        line = b"".join(self.chunks) if self.keep_line else b""
+        return header + self.stack[: self.depth] + line
+
+    @classmethod
+    def restore(cls, state: bytes) -> "IncrementalParser":
+        """Return a parser resumed from a snapshot."""
+        offset, depth, corrupted_at, symbol, keep_line = HEADER.unpack_from(state)
+        stack = state[HEADER.size : HEADER.size + depth]
+        parser = cls(keep_line, max(depth, 1 << 12))
+        parser.stack[:depth] = stack
+        parser.depth = depth
+        parser.offset = offset
+        if corrupted_at >= 0:
+            parser.corrupted_at = corrupted_at
+            parser.last_symbol = chr(symbol)
+        if keep_line:
+            parser.chunks.append(state[HEADER.size + depth :])
+        return parser
+
+    def _consume(self, chunk: bytes) -> None:
+        codes = chunk.translate(CODES)
+        if self.depth + len(codes) > len(self.stack):
+            self.stack.extend(bytes(max(len(codes), len(self.stack))))
+        stack, depth = self.stack, self.depth
+        for i, code in enumerate(codes):
+            if code == 0:
+                continue
+            if code < 5:
+                stack[depth] = code
+                depth += 1
+            else:
+                depth -= 1
+                if depth < 0 or stack[depth] != code - 4:
+                    self.corrupted_at = self.offset + i
+                    self.last_symbol = chr(chunk[i])
+                    depth += 1
+                    break
+        self.depth = depth
+
+
+def parse_chunks(chunks: Iterable[bytes | str], keep_line: bool = True) -> ParsedLine:
+    """Return a line of code parsed from consecutive chunks."""
+    parser = IncrementalParser(keep_line)
+    for chunk in chunks:
+        parser.feed(chunk)
+    return parser.finish()
+
+
+async def parse_stream(
+    reader: asyncio.StreamReader,
+    keep_line: bool = False,
+    chunk_size: int = CHUNK_SIZE,
+) -> ParsedLine:
+    """Return a line of code read from a stream until the end of file.
+
+    Reading stops early on corruption unless the line needs to be kept.
+    """
+    parser = IncrementalParser(keep_line)
+    while chunk := await reader.read(chunk_size):
+        if parser.feed(chunk) is not None and not keep_line:
+            break
+    return parser.finish()
+
+
+async def parse_streams(
+    readers: Iterable[asyncio.StreamReader], keep_line: bool = False
+) -> list[ParsedLine]:
+    """Return lines of code parsed concurrently from independent streams."""
+    return await asyncio.gather(
+        *(parse_stream(reader, keep_line) for reader in readers)
+    )
+
+
+async def parse_lines(
+    reader: asyncio.StreamReader,
+    keep_line: bool = False,
+    chunk_size: int = CHUNK_SIZE,
+) -> AsyncIterator[ParsedLine]:
+    """Return an async iterator of lines of code delimited by line breaks."""
+    parser = IncrementalParser(keep_line)
+    while chunk := await reader.read(chunk_size):
+        *lines, chunk = chunk.split(b"\n")
+        for line in lines:
+            parser.feed(line)
+            yield _strip(parser.finish())
+            parser = IncrementalParser(keep_line)
+        parser.feed(chunk)
+    if parser.offset > 0:
+        yield _strip(parser.finish())
+
+
+def _strip(parsed_line: ParsedLine) -> ParsedLine:
+    """Return the parsed line without a trailing carriage return."""
+    parsed_line.line = parsed_line.line.rstrip("\r")
+    return parsed_line
@@ -0,0 +1,83 @@
+"""
+Table-driven scanning of navigation subsystem lines streamed from a file.
+
+Each line of bytes is translated into small integer codes in one call, where
+opening brackets become 1-4 and closing brackets 5-8, with any other bytes
+deleted. Opening codes equal the completion points of their counterparts, so
+the scores of both parts come straight out of the stack of codes.
+"""
+
+from typing import BinaryIO, Iterable, Iterator, Optional
+
+OPENING = b"([{<"
+CLOSING = b")]}>"
+TABLE = bytes.maketrans(OPENING + CLOSING, bytes(range(1, 9)))
+DELETE = bytes(set(range(256)) - set(OPENING + CLOSING))
+
+CORRUPTION_POINTS = (0, 0, 0, 0, 0, 3, 57, 1197, 25137)
+
+
+class ScanResult:
+    """Status of a line, its first illegal symbol, and its score."""
+
+    __slots__ = ("status", "symbol", "score")
+
+    def __init__(self, status: str, symbol: Optional[str], score: int) -> None:
+        self.status = status
+        self.symbol = symbol
+        self.score = score
+
+    def __repr__(self) -> str:
+        return f"ScanResult({self.status!r}, {self.symbol!r}, {self.score})"
+
+
+class Scanner:
+    """Reusable scanner with a preallocated stack that grows on demand."""
+
+    def __init__(self, capacity: int = 1 << 12) -> None:
+        self.stack = bytearray(capacity)
+
+    def scan(self, line: bytes) -> ScanResult:
+        """Return the result of scanning one line of code."""
+        codes = line.translate(TABLE, DELETE)
+        if len(codes) > len(self.stack):
+            self.stack = bytearray(len(codes))
+        stack, depth = self.stack, 0
+        for code in codes:
+            if code < 5:
+                stack[depth] = code
+                depth += 1
+            else:
+                depth -= 1
+                if depth < 0 or stack[depth] != code - 4:
+                    symbol = CLOSING[code - 5 : code - 4].decode("ascii")
+                    return ScanResult("CORRUPTED", symbol, CORRUPTION_POINTS[code])
+        if depth == 0:
+            return ScanResult("OKAY", None, 0)
+        score = 0
+        for code in reversed(stack[:depth]):
+            score = score * 5 + code
+        return ScanResult("INCOMPLETE", None, score)
+
+    def scan_lines(self, lines: Iterable[bytes]) -> Iterator[ScanResult]:
+        """Return an iterator of results for consecutive lines of code."""
+        for line in lines:
+            yield self.scan(line)
+
+
+def scores(file: BinaryIO) -> tuple[int, int]:
+    """Return the scores of both parts for lines streamed from a binary file."""
+    corruption, completions = 0, []
+    for result in Scanner().scan_lines(file):
+        if result.status == "CORRUPTED":
+            corruption += result.score
+        elif result.status == "INCOMPLETE":
+            completions.append(result.score)
+    completions.sort()
+    return corruption, completions[len(completions) // 2] if completions else 0
+
+
+def solve(path: str) -> tuple[int, int]:
+    """Return the scores of both parts for the lines in a file."""
+    with open(path, "rb") as file:
+        return scores(file)
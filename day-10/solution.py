@@ -10,14 +10,34 @@ import sys
 from functools import reduce
 from pathlib import Path
 
+import incremental
+import scanner
 from parser import ParsedLine, parse
 
+sys.path.append(str(Path(__file__).parents[1]))
 
-def main(lines: list[ParsedLine]) -> None:
+from aoc import cache, profiling  # noqa: E402
+
+
+def main(lines: list[ParsedLine], path: Path) -> None:
     assert part1(lines) == 215229
     assert part2(lines) == 1105996483
 
+    assert scanner.solve(path) == (215229, 1105996483)
+
+    for line in lines:
+        chunks = (line.line[i : i + 8] for i in range(0, len(line.line), 8))
+        assert incremental.parse_chunks(chunks) == line
+
+
+@profiling.profile()
+@cache.answers()
+def answers(path: str) -> tuple[int, int]:
+    """Return the answers to both parts."""
+    return scanner.solve(path)
+
 
+@profiling.profile()
 def part1(lines: list[ParsedLine]) -> int:
     """Return the total score of all the corrupted lines."""
     points = {
@@ -29,6 +49,7 @@ def part1(lines: list[ParsedLine]) -> int:
     return sum(points[line.last_symbol] for line in lines if line.status == "CORRUPTED")
 
 
+@profiling.profile()
 def part2(lines: list[ParsedLine]) -> int:
     """Return the middle score of all the incomplete lines."""
     points = {
@@ -46,10 +67,12 @@ def part2(lines: list[ParsedLine]) -> int:
     return sorted(scores)[len(scores) // 2]
 
 
+@profiling.profile()
 def load(path: Path) -> list[ParsedLine]:
     """Return a list of parsed lines of code."""
     return [parse(line) for line in path.read_text().splitlines()]
 
 
 if __name__ == "__main__":
-    main(load(Path(sys.argv[1] if len(sys.argv) > 1 else "input.txt")))
+    path = Path(sys.argv[1] if len(sys.argv) > 1 else "input.txt")
+    main(load(path), path)
@@ -0,0 +1,149 @@
+"""
+Run the solutions of many days against many inputs on a pool of processes.
+
+Each day lives in its own directory with sibling modules imported by bare
+names, some of which clash between days, e.g. models.py or parser.py. Days
+are therefore imported under unique names, one at a time, with their own
+directory temporarily put on the module search path.
+
+Usage:
+$ python run.py
+$ python run.py 1 5 10 --input 'inputs/*.txt' --workers 8
+$ AOC_CACHE=1 python run.py  # Reuse answers of unchanged inputs and solvers
+"""
+
+import argparse
+import glob
+import importlib.util
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Iterable, Optional
+
+from aoc import profiling
+
+ROOT = Path(__file__).parent
+
+_solutions: dict[int, ModuleType] = {}
+
+
+@dataclass(frozen=True)
+class DayResult:
+    day: int
+    path: str
+    part1: Optional[int]
+    part2: Optional[int]
+    seconds: float
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __str__(self) -> str:
+        outcome = self.error if self.error else f"{self.part1:>16} {self.part2:>16}"
+        path = os.path.relpath(self.path, ROOT)
+        return f"{path:<32} {self.seconds:9.3f}s {outcome}"
+
+
+def discover() -> dict[int, Path]:
+    """Return paths of the solution modules by day number."""
+    return {
+        int(path.parent.name.removeprefix("day-")): path
+        for path in sorted(ROOT.glob("day-[0-9][0-9]/solution.py"))
+    }
+
+
+def import_day(day: int) -> ModuleType:
+    """Return the solution module of a day imported under a unique name."""
+    if day in _solutions:
+        return _solutions[day]
+    path = discover()[day]
+    siblings = {sibling.stem for sibling in path.parent.glob("*.py")}
+    for name in siblings:
+        sys.modules.pop(name, None)  # Forget modules of another day
+    spec = importlib.util.spec_from_file_location(f"day{day:02d}_solution", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.path.insert(0, str(path.parent))
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(str(path.parent))
+        for name in siblings:
+            sys.modules.pop(name, None)
+    _solutions[day] = module
+    return module
+
+
+def warm_up(days: Iterable[int]) -> None:
+    """Import NumPy and the solutions of the given days ahead of time."""
+    import numpy  # noqa: F401
+
+    for day in days:
+        import_day(day)
+
+
+def solve(day: int, path: str) -> DayResult:
+    """Return the answers of a day for one input along with the wall time."""
+    start = time.perf_counter()
+    try:
+        with profiling.stage(f"day-{day:02d}"):
+            part1, part2 = import_day(day).answers(path)
+    except Exception as ex:
+        return DayResult(day, path, None, None, time.perf_counter() - start, repr(ex))
+    return DayResult(day, path, part1, part2, time.perf_counter() - start)
+
+
+def run(tasks: list[tuple[int, str]], workers: Optional[int] = None) -> list[DayResult]:
+    """Return results of solving (day, path) pairs in the order given."""
+    days = sorted({day for day, _ in tasks})
+    workers = min(workers or os.cpu_count() or 1, max(len(tasks), 1))
+    if workers == 1:
+        warm_up(days)
+        return [solve(day, path) for day, path in tasks]
+    with ProcessPoolExecutor(workers, initializer=warm_up, initargs=(days,)) as pool:
+        return list(pool.map(solve, *zip(*tasks), chunksize=8))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("days", nargs="*", type=int, help="day numbers (all)")
+    parser.add_argument(
+        "-i",
+        "--input",
+        action="append",
+        help="glob pattern relative to each day directory (input.txt)",
+    )
+    parser.add_argument("-w", "--workers", type=int, help="number of processes")
+    return parser.parse_args()
+
+
+def main(args: argparse.Namespace) -> int:
+    solutions = discover()
+    days = args.days or list(solutions)
+    if unknown := set(days) - set(solutions):
+        sys.exit(f"No solutions for days: {sorted(unknown)}")
+    patterns = args.input or ["input.txt"]
+    tasks = [
+        (day, str(path))
+        for day in days
+        for pattern in patterns
+        for path in sorted(glob.glob(os.path.join(solutions[day].parent, pattern)))
+    ]
+    start = time.perf_counter()
+    results = run(tasks, args.workers)
+    for result in results:
+        print(result)
+    failed = sum(not result.ok for result in results)
+    print(
+        f"{len(results)} inputs, {failed} failed in {time.perf_counter() - start:.3f}s"
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(parse_args()))